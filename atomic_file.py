@@ -0,0 +1,51 @@
+"""
+Atomic text file writes.
+
+Articles, cache entries and the YouTube quota file are written through a
+temporary file in the same directory, then renamed over the target with
+``os.replace``. Readers (and a rerun after a crash) see either the previous
+content or the new one in full, never a truncated file.
+
+The temporary file comes from ``tempfile.mkstemp``, so its name is unique even
+when several threads write the same path, and a stale temporary file left by a
+killed run can't collide with it. mkstemp creates files readable by their owner
+only; the file is given the usual permissions (0666 minus the umask) before it
+replaces the target.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+# Read once at import: os.umask can only be read by setting it, which isn't thread-safe
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def write_file_atomically(path: str, text: str) -> None:
+    """
+    Write a UTF-8 text file through a temporary file renamed into place.
+
+    The temporary name ends in ``.tmp``, so listings of ``.md`` or ``.json`` files
+    never pick it up. It is removed if the write fails.
+
+    Args:
+        path: File to create or replace
+        text: Full content of the file
+
+    Raises:
+        OSError: The file couldn't be written (the target is left untouched)
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.write(text)
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,108 @@
+"""
+Content-addressed on-disk cache.
+
+Used to avoid re-running expensive calls whose inputs are byte-identical to a
+previous run: transcript downloads (keyed by video id and language) and OpenAI
+chat completions (keyed by the full request: model, messages, sampling options).
+A typical hit is a rerun after a failed Medium publish, or while tuning a
+single prompt.
+
+Entries are JSON files sharded by the first two hex characters of their key,
+e.g. ``.cache/openai/3f/3fa9...json``. Writes go through a temporary file and
+``os.replace`` (see :mod:`atomic_file`) so concurrent workers never read a
+half-written entry. Deleting the directory simply clears the cache.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import time
+from typing import Any, Callable, Optional, Set
+
+from atomic_file import write_file_atomically
+
+# Bump when the format of cached values changes, to orphan the old entries
+CACHE_SCHEMA = 1
+
+
+def cache_key(*parts: Any) -> str:
+    """Stable hash of JSON-serializable parts (dict key order doesn't matter)."""
+    payload = json.dumps((CACHE_SCHEMA, parts), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+
+class DiskCache:
+    """
+    A directory of JSON entries addressed by :func:`cache_key`.
+
+    Args:
+        directory: Where the entries are stored.
+        max_age: Seconds after which an entry is ignored (and rewritten on the next
+            ``set``). ``None`` keeps entries forever.
+    """
+
+    def __init__(self, directory: str, max_age: Optional[float] = None):
+        self.directory = directory
+        self.max_age = max_age
+        self._created_dirs: Set[str] = set()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss (or an unreadable or expired entry)."""
+        path = self._path(key)
+        try:
+            if self.max_age is not None and time.time() - os.path.getmtime(path) > self.max_age:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value. Failing to write the cache never fails the caller."""
+        path = self._path(key)
+        try:
+            # Serialized first, so an unserializable value never creates a file
+            text = json.dumps(value, ensure_ascii=False)
+            shard_dir = os.path.dirname(path)
+            if shard_dir not in self._created_dirs:
+                os.makedirs(shard_dir, exist_ok=True)
+                self._created_dirs.add(shard_dir)
+            write_file_atomically(path, text)
+        except (OSError, TypeError, ValueError) as e:
+            # TypeError/ValueError: the value isn't JSON-serializable
+            print(f"⚠ Could not write cache entry {path}: {e}")
+
+
+def disk_cached(directory: str) -> Callable:
+    """
+    Decorator caching a function's result on disk, keyed by its name and arguments.
+
+    ``None`` results are treated as failures and never cached, so a missing
+    transcript or a failed request is retried on the next run.
+
+    Args:
+        directory: Cache directory for this function.
+    """
+    cache = DiskCache(directory)
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = cache_key(func.__name__, args, kwargs)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+            result = func(*args, **kwargs)
+            if result is not None:
+                cache.set(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
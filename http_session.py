@@ -0,0 +1,72 @@
+"""
+Shared HTTP session factory.
+
+Every external REST call of the pipeline (Unsplash, Medium) goes through a
+pooled ``requests.Session`` instead of module-level ``requests.get``/``post``,
+so connections to the same host are kept alive and reused rather than paying a
+new TCP + TLS handshake per request.
+
+Transient failures (429 and 5xx) on idempotent requests are retried with
+exponential backoff by urllib3. POST requests are never retried automatically,
+so a publish can't be duplicated by a retry. Callers pass ``HTTP_TIMEOUT`` on
+every request (requests has no timeout by default). A session handed to a
+third-party client that doesn't pass one (youtube_transcript_api) is built with
+a default ``timeout`` instead.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+#: Status codes worth retrying: rate limiting and transient server errors.
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+#: (connect, read) timeout in seconds for every call, so a hung API can't freeze the pipeline.
+HTTP_TIMEOUT = (5, 30)
+
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """``HTTPAdapter`` applying a default timeout to requests sent without one."""
+
+    def __init__(self, *args: Any, timeout: Optional[Timeout] = None, **kwargs: Any) -> None:
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request: requests.PreparedRequest, timeout: Optional[Timeout] = None, **kwargs: Any) -> requests.Response:
+        return super().send(request, timeout=self.timeout if timeout is None else timeout, **kwargs)
+
+
+def build_http_session(pool_maxsize: int = 10, retries: int = 3, backoff_factor: float = 0.5,
+                       timeout: Optional[Timeout] = None) -> requests.Session:
+    """
+    Build a ``requests.Session`` with connection pooling and automatic retries.
+
+    Args:
+        pool_maxsize: Connections kept alive per host (raise it for concurrent callers).
+        retries: How many times an idempotent request is retried on a transient error.
+        backoff_factor: Base delay (in seconds) of the exponential backoff between retries.
+        timeout: Default timeout of requests sent without one (e.g. ``HTTP_TIMEOUT``).
+
+    Returns:
+        A ready-to-use ``requests.Session``.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        raise_on_status=False,
+    )
+    adapter = TimeoutHTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=retry,
+                                 timeout=timeout)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -0,0 +1,109 @@
+"""
+Processed-video index.
+
+A small SQLite file recording every (video, niche, language) article that was
+successfully published. It is loaded into memory once per run, so deciding
+whether a video still needs work is a set lookup rather than a filesystem scan,
+and a video is never published twice even if its local Markdown copy was
+moved or deleted.
+
+The Markdown files in the article directories are still written for humans
+(and for the book compiler); they just aren't the only record of what was done.
+
+It also remembers a fingerprint of every transcript whose articles were
+published, so a re-uploaded video with the same transcript is recognized
+before paying for its articles a second time.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Optional, Set, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS processed (
+    video_id TEXT NOT NULL,
+    niche TEXT NOT NULL,
+    language TEXT NOT NULL,
+    url TEXT,
+    processed_at TEXT NOT NULL,
+    PRIMARY KEY (video_id, niche, language)
+);
+CREATE TABLE IF NOT EXISTS transcripts (
+    digest TEXT PRIMARY KEY,
+    video_id TEXT NOT NULL
+)
+"""
+
+
+class ProcessedIndex:
+    """In-memory view of the ``processed`` and ``transcripts`` tables, written through on every change."""
+
+    def __init__(self, path: str = "state.db"):
+        self.path = path
+        # Transcript owners are looked up from the generation worker threads
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._connection.executescript(_SCHEMA)
+        self._connection.commit()
+        self._done: Set[Tuple[str, str, str]] = {
+            (video_id, niche, language)
+            for video_id, niche, language in self._connection.execute(
+                "SELECT video_id, niche, language FROM processed"
+            )
+        }
+        self._transcript_owners: Dict[str, str] = dict(
+            self._connection.execute("SELECT digest, video_id FROM transcripts")
+        )
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def is_processed(self, video_id: str, niche: str, language: str) -> bool:
+        """Return True when the article of this video/niche/language was already published."""
+        return (video_id, niche, language) in self._done
+
+    def mark_processed(self, video_id: str, niche: str, language: str, url: Optional[str] = None) -> None:
+        """Record a published article (idempotent)."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO processed (video_id, niche, language, url, processed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (video_id, niche, language, url, datetime.now().isoformat()),
+            )
+            self._connection.commit()
+            self._done.add((video_id, niche, language))
+
+    def transcript_owner(self, digest: str) -> Optional[str]:
+        """Return the video a transcript was published with, or None if it wasn't yet."""
+        return self._transcript_owners.get(digest)
+
+    def claim_transcript(self, digest: str, video_id: str) -> str:
+        """
+        Record ``video_id`` as the source of a transcript, unless another video already is.
+
+        Called once an article of the video was published, so a failed run never
+        keeps a transcript from its original video.
+
+        Args:
+            digest: Fingerprint of the normalized transcript
+            video_id: Video the transcript belongs to
+
+        Returns:
+            str: The video the transcript belongs to: ``video_id`` itself, or the
+            video it was first seen with (i.e. this video is a re-upload)
+        """
+        with self._lock:
+            owner = self._transcript_owners.get(digest)
+            if owner is None:
+                self._connection.execute(
+                    "INSERT INTO transcripts (digest, video_id) VALUES (?, ?)", (digest, video_id)
+                )
+                self._connection.commit()
+                self._transcript_owners[digest] = owner = video_id
+            return owner
+
+    def close(self) -> None:
+        self._connection.close()
@@ -16,12 +16,22 @@ For turning a whole collection of articles into a distributable book
 
 from __future__ import annotations
 
+import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
 
+from http_session import HTTP_TIMEOUT, build_http_session
+
+#: How many times a post rejected by Medium's rate limiting (429) is sent again.
+#: Posts are never retried on other errors: a 5xx may have created the post already.
+MEDIUM_RATE_LIMIT_RETRIES = 3
+#: Longest Retry-After honoured (seconds), so a bogus header can't stall the run for hours.
+MEDIUM_MAX_RETRY_AFTER = 300
+
 
 # ---------------------------------------------------------------------------
 # Result type
@@ -44,6 +54,16 @@ def _is_publish_status(config: Dict[str, Any]) -> bool:
     return status in ("publish", "public", "published", "live", "true")
 
 
+def _retry_after_seconds(response: requests.Response, default: float) -> float:
+    """
+    Delay requested by a 429 response's Retry-After header (in seconds), else ``default``.
+
+    The header is capped at MEDIUM_MAX_RETRY_AFTER.
+    """
+    value = response.headers.get("Retry-After", "")
+    return min(float(value), MEDIUM_MAX_RETRY_AFTER) if value.isdigit() else default
+
+
 # ---------------------------------------------------------------------------
 # Base publisher
 # ---------------------------------------------------------------------------
@@ -60,6 +80,14 @@ class BasePublisher(ABC):
     def is_configured(self) -> bool:
         """Return True when this publisher has the credentials it needs."""
 
+    def prepare(self, targets: List[Tuple[str, str]]) -> None:
+        """
+        Fetch whatever the publisher needs before its first publish (no-op by default).
+
+        Args:
+            targets: ``(niche, output_language)`` pairs the run will publish
+        """
+
     @abstractmethod
     def publish(
         self,
@@ -91,6 +119,11 @@ class MediumPublisher(BasePublisher):
     def __init__(self, config: Dict[str, Any], html_converter: Callable[[str, str], str]):
         super().__init__(config)
         self._html_converter = html_converter
+        # One keep-alive session for every Medium API call of the run
+        self._session = build_http_session()
+        # The token's user id never changes, so /v1/me is only called once (until a 401)
+        self._user_id: Optional[str] = None
+        self._user_id_lock = threading.Lock()
 
     def is_configured(self) -> bool:
         return bool(self.config.get("MEDIUM_ACCESS_TOKEN"))
@@ -102,8 +135,36 @@ class MediumPublisher(BasePublisher):
             return self.config.get("MEDIUM_FR_PUBLICATION_ID")
         return self.config.get("MEDIUM_EN_PUBLICATION_ID")
 
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.config['MEDIUM_ACCESS_TOKEN']}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Accept-Charset": "utf-8",
+        }
+
+    def _get_user_id(self, headers: Dict[str, str]) -> str:
+        """Return the Medium user id of the access token, fetching it on first use only."""
+        # The lock makes a publish wait for an in-flight prefetch instead of fetching twice
+        with self._user_id_lock:
+            if self._user_id is None:
+                user_info = self._session.get("https://api.medium.com/v1/me", headers=headers, timeout=HTTP_TIMEOUT)
+                user_info.raise_for_status()
+                self._user_id = user_info.json()["data"]["id"]
+            return self._user_id
+
+    def _target_publication_id(self, output_language: str, niche: str) -> Optional[str]:
+        """Publication an article is posted to, or None when it goes to the user's profile."""
+        if not self.config.get("POST_TO_PUBLICATION", False):
+            return None
+        return self._select_publication_id(output_language, niche)
+
+    def prepare(self, targets: List[Tuple[str, str]]) -> None:
+        # Every post going to a publication never needs /v1/me: don't spend a request on it
+        if any(not self._target_publication_id(output_language, niche) for niche, output_language in targets):
+            self._get_user_id(self._headers())
+
     def publish(self, *, title, content, tags, output_language, niche) -> PublishResult:
-        token = self.config["MEDIUM_ACCESS_TOKEN"]
         publish_status = "public" if _is_publish_status(self.config) else "draft"
         html_content = self._html_converter(content, title)
 
@@ -114,41 +175,42 @@ class MediumPublisher(BasePublisher):
             "tags": tags[:5],  # Medium allows up to 5 tags
             "publishStatus": publish_status,
         }
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "Accept-Charset": "utf-8",
-        }
-
-        response = None
-        try:
-            publication_id = self._select_publication_id(output_language, niche)
-            post_to_publication = self.config.get("POST_TO_PUBLICATION", False)
-
-            if post_to_publication and publication_id:
-                response = requests.post(
-                    f"https://api.medium.com/v1/publications/{publication_id}/posts",
-                    headers=headers,
-                    json=article,
-                )
-            else:
-                user_info = requests.get("https://api.medium.com/v1/me", headers=headers)
-                user_info.raise_for_status()
-                user_id = user_info.json()["data"]["id"]
-                response = requests.post(
-                    f"https://api.medium.com/v1/users/{user_id}/posts",
-                    headers=headers,
-                    json=article,
-                )
+        headers = self._headers()
 
-            response.raise_for_status()
-            url = response.json()["data"]["url"]
-            return PublishResult(self.name, True, url=url)
+        publication_id = self._target_publication_id(output_language, niche)
 
-        except Exception as e:
-            detail = response.text if response is not None else "No response"
-            return PublishResult(self.name, False, error=f"{e} | {detail}")
+        if publication_id:
+            url = f"https://api.medium.com/v1/publications/{publication_id}/posts"
+        else:
+            try:
+                user_id = self._get_user_id(headers)
+            except (requests.RequestException, KeyError, ValueError) as e:
+                return PublishResult(self.name, False, error=f"Could not get the Medium user id: {e}")
+            url = f"https://api.medium.com/v1/users/{user_id}/posts"
+
+        for attempt in range(MEDIUM_RATE_LIMIT_RETRIES + 1):
+            try:
+                response = self._session.post(url, headers=headers, json=article, timeout=HTTP_TIMEOUT)
+            except requests.RequestException as e:
+                return PublishResult(self.name, False, error=f"{e} | No response")
+
+            if response.status_code != 429 or attempt == MEDIUM_RATE_LIMIT_RETRIES:
+                break
+            delay = _retry_after_seconds(response, default=5 * 2 ** attempt)
+            print(f"⚠ Medium rate limit reached. Retrying in {delay:.0f}s...")
+            time.sleep(delay)
+
+        if response.status_code in (200, 201):
+            try:
+                return PublishResult(self.name, True, url=response.json()["data"]["url"])
+            except (KeyError, TypeError, ValueError) as e:
+                return PublishResult(self.name, False, error=f"Unexpected response: {e} | {response.text}")
+
+        if response.status_code == 401:
+            # Revoked or replaced token: look the user id up again on the next publish
+            with self._user_id_lock:
+                self._user_id = None
+        return PublishResult(self.name, False, error=f"HTTP {response.status_code} | {response.text}")
 
 
 # ---------------------------------------------------------------------------
@@ -206,6 +268,28 @@ def build_publishers(
     return publishers
 
 
+def prepare_publishers_in_background(publishers: List[BasePublisher], targets: List[Tuple[str, str]]) -> None:
+    """
+    Run every publisher's ``prepare()`` on a background thread.
+
+    Lookups such as Medium's ``/v1/me`` then overlap with the YouTube listing and the
+    first article generation instead of delaying the first publish. Failures are only
+    reported: ``publish()`` retries the lookup itself.
+
+    Args:
+        publishers: Publishers returned by ``build_publishers``
+        targets: ``(niche, output_language)`` pairs the run will publish
+    """
+    def prepare(publisher: BasePublisher) -> None:
+        try:
+            publisher.prepare(targets)
+        except Exception as e:
+            print(f"⚠ Could not prepare publisher {publisher.name}: {e}")
+
+    for publisher in publishers:
+        threading.Thread(target=prepare, args=(publisher,), name=f"prepare-{publisher.name}", daemon=True).start()
+
+
 def publish_to_all(
     publishers: List[BasePublisher],
     *,
@@ -0,0 +1,43 @@
+"""Import helper for the main script, whose file name isn't a valid module name."""
+
+import atexit
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "transform-youtube-videos-to-medium-posts.py"
+MODULE_NAME = "transform_youtube_videos_to_medium_posts"
+
+
+def load_main_script():
+    """Import the main script once, reading a minimal config.json from a temporary directory."""
+    if MODULE_NAME in sys.modules:
+        return sys.modules[MODULE_NAME]
+
+    previous_dir = os.getcwd()
+    work_dir = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, work_dir, True)
+    config = {
+        "OPENAI_API_KEY": "test",
+        "OPENAI_MODEL": "test-model",
+        "UNSPLASH_ACCESS_KEY": "test",
+        "MEDIUM_ACCESS_TOKEN": "test",
+        "CACHE_DIR": os.path.join(work_dir, ".cache"),
+        "YOUTUBE_QUOTA_FILE": os.path.join(work_dir, "youtube_quota.json"),
+    }
+    with open(os.path.join(work_dir, "config.json"), "w", encoding="utf-8") as f:
+        json.dump(config, f)
+
+    spec = importlib.util.spec_from_file_location(MODULE_NAME, SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    os.chdir(work_dir)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        os.chdir(previous_dir)
+    sys.modules[MODULE_NAME] = module
+    return module
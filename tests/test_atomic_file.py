@@ -0,0 +1,60 @@
+import os
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+import atomic_file
+from atomic_file import write_file_atomically
+
+
+class WriteFileAtomicallyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+        self.path = os.path.join(self.directory, "article.md")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def read(self, path: str) -> str:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_replaces_the_file_and_leaves_no_temporary_file(self) -> None:
+        write_file_atomically(self.path, "first")
+        write_file_atomically(self.path, "seconde réécriture")
+
+        self.assertEqual(self.read(self.path), "seconde réécriture")
+        self.assertEqual(os.listdir(self.directory), ["article.md"])
+
+    def test_stale_temporary_files_are_left_alone(self) -> None:
+        stale = os.path.join(self.directory, f"article.md.{os.getpid()}-1.tmp")
+        with open(stale, "w", encoding="utf-8") as f:
+            f.write("left by a killed run")
+
+        write_file_atomically(self.path, "content")
+
+        self.assertEqual(self.read(self.path), "content")
+        self.assertEqual(self.read(stale), "left by a killed run")
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions")
+    def test_file_gets_the_usual_permissions(self) -> None:
+        write_file_atomically(self.path, "content")
+
+        mode = stat.S_IMODE(os.stat(self.path).st_mode)
+        self.assertEqual(mode, 0o666 & ~atomic_file._UMASK)
+
+    def test_failed_write_keeps_the_previous_content(self) -> None:
+        write_file_atomically(self.path, "previous")
+
+        with mock.patch.object(atomic_file.os, "replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                write_file_atomically(self.path, "new")
+
+        self.assertEqual(self.read(self.path), "previous")
+        self.assertEqual(os.listdir(self.directory), ["article.md"])
+
+
+if __name__ == "__main__":
+    unittest.main()
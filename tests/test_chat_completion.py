@@ -0,0 +1,79 @@
+import types
+import unittest
+from unittest import mock
+
+import openai
+
+from main_script import load_main_script
+
+
+def completion(content: str):
+    return types.SimpleNamespace(choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=content))])
+
+
+def bad_request(message: str, param: str = None) -> openai.BadRequestError:
+    response = mock.Mock(status_code=400, headers={})
+    return openai.BadRequestError(message, response=response, body={"message": message, "param": param})
+
+
+class ChatCompletionCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.script = load_main_script()
+
+    def setUp(self) -> None:
+        self.create = mock.Mock(side_effect=[completion("first"), completion("second")])
+        patcher = mock.patch.object(self.script.openai_client.chat.completions, "create", self.create)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def request(self, temperature: float, text: str):
+        return dict(model="test-model", messages=[{"role": "user", "content": text}], temperature=temperature)
+
+    def test_sampled_completions_are_never_replayed(self) -> None:
+        request = self.request(0.9, "tags for an article")
+
+        self.assertEqual(self.script.chat_completion(**request), "first")
+        self.assertEqual(self.script.chat_completion(**request), "second")
+        self.assertEqual(self.create.call_count, 2)
+
+    def test_deterministic_completions_are_cached(self) -> None:
+        request = self.request(0, "a deterministic question")
+
+        self.assertEqual(self.script.chat_completion(**request), "first")
+        self.assertEqual(self.script.chat_completion(**request), "first")
+        self.assertEqual(self.create.call_count, 1)
+
+
+class JsonChatCompletionTest(unittest.TestCase):
+    SCHEMA = {"type": "json_schema", "json_schema": {"name": "tags", "strict": True, "schema": {}}}
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.script = load_main_script()
+
+    def complete(self, *responses):
+        create = mock.Mock(side_effect=list(responses))
+        with mock.patch.object(self.script.openai_client.chat.completions, "create", create):
+            content = self.script.json_chat_completion(
+                self.SCHEMA, model="test-model", messages=[{"role": "user", "content": "tags"}], temperature=0.9)
+        return content, [call.kwargs["response_format"] for call in create.call_args_list]
+
+    def test_falls_back_to_json_mode_when_structured_outputs_are_unsupported(self) -> None:
+        unsupported = bad_request("Invalid parameter: 'response_format' of type 'json_schema' is not supported "
+                                  "with this model.", param="response_format")
+
+        content, formats = self.complete(unsupported, completion('{"tags": []}'))
+
+        self.assertEqual(content, '{"tags": []}')
+        self.assertEqual(formats, [self.SCHEMA, {"type": "json_object"}])
+
+    def test_other_bad_requests_are_not_retried(self) -> None:
+        too_long = bad_request("This model's maximum context length is 128000 tokens.", param="messages")
+
+        with self.assertRaises(openai.BadRequestError):
+            self.complete(too_long, completion('{"tags": []}'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import io
+import os
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+
+from disk_cache import DiskCache, cache_key, disk_cached
+
+
+class CacheKeyTest(unittest.TestCase):
+    def test_key_is_stable_and_ignores_dict_order(self) -> None:
+        first = cache_key({"model": "m", "messages": [{"role": "user", "content": "hi"}]})
+        second = cache_key({"messages": [{"content": "hi", "role": "user"}], "model": "m"})
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 40)
+
+    def test_different_parts_give_different_keys(self) -> None:
+        self.assertNotEqual(cache_key("get_video_transcript", ("abc", "en")),
+                            cache_key("get_video_transcript", ("abc", "fr")))
+
+
+class DiskCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _files(self):
+        return sorted(name for _, _, names in os.walk(self.directory) for name in names)
+
+    def test_set_then_get_round_trip(self) -> None:
+        cache = DiskCache(self.directory)
+        key = cache_key("question")
+        self.assertIsNone(cache.get(key))
+
+        cache.set(key, {"answer": "réponse", "tags": ["a", "b"]})
+
+        self.assertEqual(cache.get(key), {"answer": "réponse", "tags": ["a", "b"]})
+        self.assertEqual(self._files(), [f"{key}.json"])
+
+    def test_entries_older_than_max_age_are_ignored(self) -> None:
+        cache = DiskCache(self.directory, max_age=60)
+        key = cache_key("old")
+        cache.set(key, "value")
+        self.assertEqual(cache.get(key), "value")
+
+        path = os.path.join(self.directory, key[:2], f"{key}.json")
+        an_hour_ago = time.time() - 3600
+        os.utime(path, (an_hour_ago, an_hour_ago))
+
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(DiskCache(self.directory).get(key), "value")
+
+    def test_unreadable_entry_is_a_miss(self) -> None:
+        cache = DiskCache(self.directory)
+        key = cache_key("broken")
+        cache.set(key, "value")
+        with open(os.path.join(self.directory, key[:2], f"{key}.json"), "w", encoding="utf-8") as f:
+            f.write("{not json")
+
+        self.assertIsNone(cache.get(key))
+
+    def test_unserializable_value_does_not_fail_or_leak_a_temporary_file(self) -> None:
+        cache = DiskCache(self.directory)
+        key = cache_key("set")
+
+        with redirect_stdout(io.StringIO()) as output:
+            cache.set(key, {1, 2})
+
+        self.assertIn("Could not write cache entry", output.getvalue())
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(self._files(), [])
+
+
+class DiskCachedTest(unittest.TestCase):
+    def test_results_are_reused_and_none_is_never_cached(self) -> None:
+        calls = []
+
+        with tempfile.TemporaryDirectory() as directory:
+            @disk_cached(directory)
+            def lookup(video_id: str):
+                calls.append(video_id)
+                return None if video_id == "missing" else f"transcript of {video_id}"
+
+            self.assertEqual(lookup("abc"), "transcript of abc")
+            self.assertEqual(lookup("abc"), "transcript of abc")
+            self.assertIsNone(lookup("missing"))
+            self.assertIsNone(lookup("missing"))
+
+        self.assertEqual(calls, ["abc", "missing", "missing"])
+
+
+if __name__ == "__main__":
+    unittest.main()
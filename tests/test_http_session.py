@@ -0,0 +1,41 @@
+import unittest
+from unittest import mock
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_session import HTTP_TIMEOUT, RETRY_STATUS_CODES, TimeoutHTTPAdapter, build_http_session
+
+
+class BuildHttpSessionTest(unittest.TestCase):
+    def test_retries_transient_errors_on_idempotent_requests_only(self) -> None:
+        session = build_http_session(pool_maxsize=4, retries=2)
+        adapter = session.get_adapter("https://api.unsplash.com/search/photos")
+        retry = adapter.max_retries
+
+        self.assertEqual(retry.total, 2)
+        self.assertEqual(set(retry.status_forcelist), set(RETRY_STATUS_CODES))
+        self.assertIn("GET", retry.allowed_methods)
+        self.assertNotIn("POST", retry.allowed_methods)
+        self.assertEqual(adapter._pool_maxsize, 4)
+
+    def test_default_timeout_only_applies_when_none_is_given(self) -> None:
+        session = build_http_session(timeout=HTTP_TIMEOUT)
+        response = requests.Response()
+        response.status_code = 200
+
+        with mock.patch.object(HTTPAdapter, "send", return_value=response) as send:
+            session.get("https://www.youtube.com/watch?v=abc")
+            session.get("https://www.youtube.com/watch?v=abc", timeout=3)
+
+        self.assertEqual(send.call_args_list[0].kwargs["timeout"], HTTP_TIMEOUT)
+        self.assertEqual(send.call_args_list[1].kwargs["timeout"], 3)
+
+    def test_no_default_timeout_unless_asked(self) -> None:
+        adapter = build_http_session().get_adapter("https://api.medium.com/v1/me")
+        self.assertIsInstance(adapter, TimeoutHTTPAdapter)
+        self.assertIsNone(adapter.timeout)
+
+
+if __name__ == "__main__":
+    unittest.main()
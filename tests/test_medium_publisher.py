@@ -0,0 +1,129 @@
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from typing import Any, Dict, Optional
+from unittest import mock
+
+import requests
+
+import publishers
+from publishers import MEDIUM_MAX_RETRY_AFTER, MEDIUM_RATE_LIMIT_RETRIES, MediumPublisher
+
+
+def make_response(status_code: int, body: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = json.dumps(body or {}).encode("utf-8")
+    return response
+
+
+ME = make_response(200, {"data": {"id": "user-1"}})
+CREATED = make_response(201, {"data": {"url": "https://medium.com/@me/post-1"}})
+
+
+class MediumPublisherTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.publisher = MediumPublisher({"MEDIUM_ACCESS_TOKEN": "token"}, lambda content, title: content)
+        self.session = mock.Mock()
+        self.session.get.return_value = ME
+        self.publisher._session = self.session
+        sleep = mock.patch.object(publishers.time, "sleep")
+        self.sleep = sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def publish(self):
+        with redirect_stdout(io.StringIO()):
+            return self.publisher.publish(title="Title", content="<p>Body</p>", tags=["a"],
+                                          output_language="en", niche="self-help")
+
+    def sleeps(self):
+        return [call.args[0] for call in self.sleep.call_args_list]
+
+    def test_retry_after_seconds_are_honoured(self) -> None:
+        self.session.post.side_effect = [make_response(429, headers={"Retry-After": "7"}), CREATED]
+
+        result = self.publish()
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.url, "https://medium.com/@me/post-1")
+        self.assertEqual(self.sleeps(), [7.0])
+
+    def test_retry_after_is_capped(self) -> None:
+        self.session.post.side_effect = [make_response(429, headers={"Retry-After": "86400"}), CREATED]
+
+        self.assertTrue(self.publish().success)
+        self.assertEqual(self.sleeps(), [MEDIUM_MAX_RETRY_AFTER])
+
+    def test_missing_or_invalid_retry_after_falls_back_to_exponential_backoff(self) -> None:
+        self.session.post.side_effect = [
+            make_response(429),
+            make_response(429, headers={"Retry-After": "soon"}),
+            CREATED,
+        ]
+
+        self.assertTrue(self.publish().success)
+        self.assertEqual(self.sleeps(), [5, 10])
+
+    def test_gives_up_after_the_last_retry(self) -> None:
+        self.session.post.return_value = make_response(429)
+
+        result = self.publish()
+
+        self.assertFalse(result.success)
+        self.assertTrue(result.error.startswith("HTTP 429"))
+        self.assertEqual(self.session.post.call_count, MEDIUM_RATE_LIMIT_RETRIES + 1)
+        self.assertEqual(len(self.sleep.call_args_list), MEDIUM_RATE_LIMIT_RETRIES)
+
+    def test_other_errors_are_not_retried(self) -> None:
+        self.session.post.return_value = make_response(503)
+
+        self.assertFalse(self.publish().success)
+        self.assertEqual(self.session.post.call_count, 1)
+        self.sleep.assert_not_called()
+
+    def test_user_id_is_fetched_once_and_again_after_a_401(self) -> None:
+        self.session.post.side_effect = [CREATED, make_response(401), CREATED]
+
+        self.assertTrue(self.publish().success)
+        self.assertEqual(self.session.get.call_count, 1)
+
+        self.assertFalse(self.publish().success)
+        self.assertTrue(self.publish().success)
+
+        self.assertEqual(self.session.get.call_count, 2)
+        self.assertTrue(self.session.post.call_args.args[0].endswith("/users/user-1/posts"))
+
+
+class MediumPrepareTest(unittest.TestCase):
+    PUBLICATIONS = {
+        "MEDIUM_EN_PUBLICATION_ID": "en-pub",
+        "MEDIUM_FR_PUBLICATION_ID": "fr-pub",
+        "MEDIUM_TECH_PUBLICATION_ID": "tech-pub",
+    }
+    TARGETS = [("self-help", "en"), ("self-help", "fr"), ("tech", "en")]
+
+    def prepare(self, targets=TARGETS, **config: Any) -> mock.Mock:
+        publisher = MediumPublisher({"MEDIUM_ACCESS_TOKEN": "token", **config}, lambda content, title: content)
+        publisher._session = mock.Mock()
+        publisher._session.get.return_value = ME
+        publisher.prepare(targets)
+        return publisher._session.get
+
+    def test_user_id_is_prefetched_for_profile_posts(self) -> None:
+        self.prepare(**self.PUBLICATIONS).assert_called_once()
+
+    def test_no_prefetch_when_every_post_goes_to_a_publication(self) -> None:
+        self.prepare(POST_TO_PUBLICATION=True, **self.PUBLICATIONS).assert_not_called()
+
+    def test_prefetch_when_a_target_lacks_a_publication(self) -> None:
+        publications = {"MEDIUM_TECH_PUBLICATION_ID": "tech-pub", "MEDIUM_EN_PUBLICATION_ID": "en-pub"}
+
+        self.prepare(POST_TO_PUBLICATION=True, **publications).assert_called_once()
+        self.prepare([("tech", "en")], POST_TO_PUBLICATION=True, **publications).assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
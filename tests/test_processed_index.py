@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+
+from processed_index import ProcessedIndex
+
+
+class ProcessedIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "state.db")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_mark_processed_survives_a_reopen(self) -> None:
+        index = ProcessedIndex(self.path)
+        self.assertFalse(index.is_processed("abc", "tech", "en"))
+
+        index.mark_processed("abc", "tech", "en", "https://medium.com/p/1")
+        index.mark_processed("abc", "tech", "en", "https://medium.com/p/1")  # idempotent
+        index.close()
+
+        reopened = ProcessedIndex(self.path)
+        self.addCleanup(reopened.close)
+        self.assertTrue(reopened.is_processed("abc", "tech", "en"))
+        self.assertFalse(reopened.is_processed("abc", "tech", "fr"))
+        self.assertFalse(reopened.is_processed("abc", "self-help", "en"))
+        self.assertEqual(len(reopened), 1)
+
+    def test_first_video_keeps_the_transcript(self) -> None:
+        index = ProcessedIndex(self.path)
+        self.assertIsNone(index.transcript_owner("digest"))
+        self.assertEqual(index.claim_transcript("digest", "original"), "original")
+        self.assertEqual(index.claim_transcript("digest", "original"), "original")
+        self.assertEqual(index.claim_transcript("digest", "reupload"), "original")
+        self.assertEqual(index.claim_transcript("other", "reupload"), "reupload")
+        index.close()
+
+        reopened = ProcessedIndex(self.path)
+        self.addCleanup(reopened.close)
+        self.assertEqual(reopened.transcript_owner("digest"), "original")
+        self.assertEqual(reopened.claim_transcript("digest", "reupload"), "original")
+
+
+if __name__ == "__main__":
+    unittest.main()
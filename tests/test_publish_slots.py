@@ -0,0 +1,74 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from main_script import load_main_script
+
+
+class _FakeClock:
+    """Stand-in for the time module: sleeping advances the clock instead of waiting."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class WaitForPublishSlotTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.script = load_main_script()
+
+    def setUp(self) -> None:
+        self.clock = _FakeClock()
+        patcher = mock.patch.object(self.script, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.script.publish_slots.clear()
+        self.addCleanup(self.script.publish_slots.clear)
+        self.period = self.script.RATE_LIMIT_PERIOD_SECONDS
+
+    def wait(self) -> str:
+        with redirect_stdout(io.StringIO()) as output:
+            self.script.wait_for_publish_slot()
+        return output.getvalue()
+
+    def test_first_publish_does_not_wait(self) -> None:
+        self.assertEqual(self.wait(), "")
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_only_the_rest_of_the_period_is_waited(self) -> None:
+        self.wait()
+        self.clock.now += 100  # generating the next article took part of the period
+
+        output = self.wait()
+
+        self.assertEqual(self.clock.sleeps, [self.period - 100])
+        self.assertIn(f"Waiting {self.period - 100} seconds", output)
+
+    def test_no_wait_once_a_full_period_has_passed(self) -> None:
+        self.wait()
+        self.clock.now += self.period
+
+        self.wait()
+
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_back_to_back_publishes_are_spaced_by_a_period(self) -> None:
+        start = self.clock.now
+        for _ in range(3):
+            self.wait()
+
+        self.assertEqual(self.clock.sleeps, [self.period, self.period])
+        self.assertEqual(self.clock.now, start + 2 * self.period)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+import youtube_quota
+from youtube_quota import YouTubeQuota
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() returns ``instant`` (a UTC datetime) in the requested time zone."""
+
+    instant = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.instant.astimezone(tz)
+
+
+class YouTubeQuotaTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "youtube_quota.json")
+        patcher = mock.patch.object(youtube_quota, "datetime", _FrozenDatetime)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        _FrozenDatetime.instant = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_calls_are_refused_once_the_budget_is_spent(self) -> None:
+        quota = YouTubeQuota(self.path, daily_limit=150)
+
+        self.assertTrue(quota.acquire("search.list"))
+        self.assertFalse(quota.acquire("search.list"))
+        self.assertEqual(quota.remaining, 50)  # a refused call reserves nothing
+
+        self.assertTrue(quota.acquire("videos.list", cost=50))
+        self.assertFalse(quota.acquire("videos.list"))
+        self.assertEqual(quota.remaining, 0)
+
+    def test_usage_is_shared_by_runs_of_the_same_day(self) -> None:
+        quota = YouTubeQuota(self.path, daily_limit=10)
+        for _ in range(4):
+            quota.acquire("playlistItems.list")
+
+        self.assertEqual(YouTubeQuota(self.path, daily_limit=10).remaining, 6)
+
+    def test_usage_of_a_previous_day_is_ignored(self) -> None:
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"day": "2026-01-14", "used": 10}, f)
+
+        self.assertEqual(YouTubeQuota(self.path, daily_limit=10).remaining, 10)
+
+    def test_budget_resets_at_midnight_pacific_time(self) -> None:
+        # 07:59 UTC is still 23:59 the previous day in Los Angeles (UTC-8 in January)
+        _FrozenDatetime.instant = datetime(2026, 1, 15, 7, 59, tzinfo=timezone.utc)
+        quota = YouTubeQuota(self.path, daily_limit=2)
+        self.assertTrue(quota.acquire("videos.list", cost=2))
+        self.assertFalse(quota.acquire("videos.list"))
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"day": "2026-01-14", "used": 2})
+
+        _FrozenDatetime.instant = datetime(2026, 1, 15, 8, 0, tzinfo=timezone.utc)
+        self.assertEqual(quota.remaining, 2)
+        self.assertTrue(quota.acquire("videos.list"))
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"day": "2026-01-15", "used": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,34 +4,53 @@ import re
 import time
 import random
 import argparse
-import isodate
-from typing import List, Dict, Optional, Any
+import bisect
+import functools
+import hashlib
+import threading
+from collections import deque
+from operator import attrgetter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Set, Deque, Tuple, Callable
 from dataclasses import dataclass
 from datetime import datetime
-from ratelimit import limits, sleep_and_retry
 
 # Google/YouTube API related imports
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+import google_auth_httplib2
+import httplib2
 import youtube_transcript_api
 
-# OpenAI and HTTP requests
+# OpenAI
 import openai
-import requests
 
 # Markdown to HTML conversion
 import markdown as md_lib
 
 # Publishing layer (Medium) and book compilation (EPUB/PDF for Amazon KDP, ...)
-from publishers import build_publishers, publish_to_all, select_primary_url
+from publishers import build_publishers, prepare_publishers_in_background, publish_to_all, select_primary_url
+from http_session import HTTP_TIMEOUT, build_http_session
+from processed_index import ProcessedIndex
+from atomic_file import write_file_atomically
+from disk_cache import DiskCache, cache_key, disk_cached
+from youtube_quota import DEFAULT_DAILY_QUOTA, YouTubeQuota
 from book_compiler import compile_book, tag_frequencies
 
 RATE_LIMIT_PERIOD_SECONDS = 300 # 5 minute
 MAX_CALLS_IN_PERIOD = 1
 LONG_ARTICLE_THRESHOLD = 2499
 VERY_LONG_ARTICLE_THRESHOLD = 5800
+DEFAULT_MAX_CONCURRENT_VIDEOS = 3 # Videos generated ahead of the (rate-limited) publishing step
+YOUTUBE_DETAILS_WORKERS = 8 # Concurrent videos.list requests when listing a channel
+YOUTUBE_MAX_RETRIES = 5 # Retries (with exponential backoff) of a failing YouTube API call
+YOUTUBE_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+YOUTUBE_QUOTA_REASONS = {'quotaExceeded', 'dailyLimitExceeded'}
+YOUTUBE_RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+TITLE_CONTEXT_CHARS = 620 # Beginning of the article the title and tags are generated from
 
 # Video duration thresholds (in seconds)
 SHORT_VIDEO_DURATION = 600  # 10 minutes
@@ -46,6 +65,19 @@ MEDIUM_VIDEO_TRANSCRIPT_LIMIT = 102000  # ~20k-25k words (2.5x base)
 LONG_VIDEO_TRANSCRIPT_LIMIT = 204000  # ~40k-50k words (5x base) - for 40min videos
 VERY_LONG_VIDEO_TRANSCRIPT_LIMIT = 306000  # ~60k-75k words (7.5x base) - for 60min+ videos
 
+# (transcript limit, max completion tokens, progress message) for videos longer than each
+# threshold of VIDEO_DURATION_THRESHOLDS, looked up with bisect (index 0: up to SHORT_VIDEO_DURATION).
+# For 40+ minute videos, capture significantly more context for quality articles
+VIDEO_DURATION_THRESHOLDS = (SHORT_VIDEO_DURATION, MEDIUM_VIDEO_DURATION, LONG_VIDEO_DURATION, VERY_LONG_VIDEO_DURATION)
+VIDEO_DURATION_SETTINGS = (
+    (SHORT_VIDEO_TRANSCRIPT_LIMIT, 5000, "✓ Processing short video ({minutes} minutes)"),
+    (MEDIUM_VIDEO_TRANSCRIPT_LIMIT, 7000, "✓ Processing medium video ({minutes} minutes)"),
+    (MEDIUM_VIDEO_TRANSCRIPT_LIMIT, 8000, "✓ Processing medium-long video ({minutes} minutes) with enhanced context"),
+    # Sweet spot for 40-60 minute videos
+    (LONG_VIDEO_TRANSCRIPT_LIMIT, 12000, "✓ Processing long video ({minutes} minutes) with extended context for in-depth article"),
+    (VERY_LONG_VIDEO_TRANSCRIPT_LIMIT, 16000, "✓ Processing very long video ({minutes} minutes) with maximum context capture"),
+)
+
 
 @dataclass
 class UnsplashImage:
@@ -61,8 +93,38 @@ class VideoData:
     published_at: str
     duration_seconds: int = 0
 
-@sleep_and_retry
-@limits(calls=MAX_CALLS_IN_PERIOD, period=RATE_LIMIT_PERIOD_SECONDS) # 1 call for every 3 minutes
+@dataclass
+class GeneratedArticle:
+    title: str
+    tags: List[str]
+    content: str
+    transcript_digest: Optional[str] = None  # Recorded once published, see transcript_digest()
+
+# Start times of the publishing slots taken within the last RATE_LIMIT_PERIOD_SECONDS
+publish_slots: Deque[float] = deque()
+
+def wait_for_publish_slot() -> None:
+    """
+    Block until another article may be published.
+
+    Publishing is throttled to MAX_CALLS_IN_PERIOD per RATE_LIMIT_PERIOD_SECONDS so
+    the Medium account isn't flagged for bulk posting. Only sleeps when the
+    previous publish was less than a period ago (generating the next article
+    usually takes part of the period already).
+    """
+    now = time.monotonic()
+    while publish_slots and now - publish_slots[0] >= RATE_LIMIT_PERIOD_SECONDS:
+        publish_slots.popleft()
+
+    if len(publish_slots) >= MAX_CALLS_IN_PERIOD:
+        delay = publish_slots[0] + RATE_LIMIT_PERIOD_SECONDS - now
+        print(f"Waiting {delay:.0f} seconds for a publishing slot "
+              f"({MAX_CALLS_IN_PERIOD} article every {RATE_LIMIT_PERIOD_SECONDS} seconds)...")
+        time.sleep(delay)
+        publish_slots.popleft()
+
+    publish_slots.append(time.monotonic())
+
 def print_progress_separator(index: int, total: int, title: str) -> None:
     """
     Print a formatted progress separator with video information.
@@ -74,9 +136,10 @@ def print_progress_separator(index: int, total: int, title: str) -> None:
     print(f"Start Processing: {title}")
     print("=" * len(separator))
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
     """
-    Load configuration from config.json file.
+    Load configuration from config.json file (read and parsed once per process).
 
     Returns:
         Dict[str, Any]: Configuration dictionary
@@ -87,6 +150,39 @@ def load_config() -> Dict[str, Any]:
 # Load configuration
 config = load_config()
 
+# Pooled keep-alive session shared by all Unsplash requests. Every video generated
+# concurrently can have a few requests in flight (one per output language and search),
+# so the pool grows with MAX_CONCURRENT_VIDEOS instead of discarding connections
+MAX_CONCURRENT_VIDEOS = max(1, int(config.get('MAX_CONCURRENT_VIDEOS', DEFAULT_MAX_CONCURRENT_VIDEOS)))
+http_session = build_http_session(pool_maxsize=max(10, 4 * MAX_CONCURRENT_VIDEOS))
+UNSPLASH_SEARCH_URL = "https://api.unsplash.com/search/photos"
+
+# Single OpenAI client (thread-safe, keeps its HTTP connections alive between requests).
+# Articles are streamed and the other requests are short, so a read stalled for 2 minutes
+# means a dead connection (the SDK default waits 10): give up and let the SDK retry it
+OPENAI_TIMEOUT = openai.Timeout(120.0, connect=10.0)
+OPENAI_MAX_RETRIES = 3
+# Required settings, read once (a missing key fails at startup rather than mid-run)
+OPENAI_MODEL = config['OPENAI_MODEL']
+openai_client = openai.OpenAI(api_key=config['OPENAI_API_KEY'], timeout=OPENAI_TIMEOUT, max_retries=OPENAI_MAX_RETRIES)
+
+# Transcripts and deterministic OpenAI completions are cached on disk so reruns don't pay for them again
+CACHE_DIR = config.get('CACHE_DIR', '.cache')
+# Completions expire after OPENAI_CACHE_DAYS so a long-lived cache picks up model updates
+OPENAI_CACHE_DAYS = config.get('OPENAI_CACHE_DAYS', 30)
+openai_cache = DiskCache(os.path.join(CACHE_DIR, 'openai'), max_age=OPENAI_CACHE_DAYS * 86400)
+# Unsplash search results, reused when another article runs the same search (same query and page)
+unsplash_cache = DiskCache(os.path.join(CACHE_DIR, 'unsplash'), max_age=30 * 86400)
+# Last YouTube API responses (and their ETags), to revalidate instead of re-downloading. They
+# expire so a channel that stopped changing still gets a full response now and then
+youtube_cache = DiskCache(os.path.join(CACHE_DIR, 'youtube'), max_age=7 * 86400)
+
+# Units spent on the YouTube Data API today, shared by every run of the day
+youtube_quota = YouTubeQuota(
+    config.get('YOUTUBE_QUOTA_FILE', 'youtube_quota.json'),
+    config.get('YOUTUBE_DAILY_QUOTA', DEFAULT_DAILY_QUOTA)
+)
+
 # YouTube API setup
 SCOPES = ["https://www.googleapis.com/auth/youtube.force-ssl"]
 
@@ -108,8 +204,30 @@ def get_authenticated_service():
             creds = flow.run_local_server(port=0)
         with open("token.json", "w", encoding='utf-8') as token:  # Added encoding parameter
             token.write(creds.to_json())
-    return build("youtube", "v3", credentials=creds)
+    return build("youtube", "v3", http=build_youtube_http(creds))
 
+def build_youtube_http(credentials) -> google_auth_httplib2.AuthorizedHttp:
+    """
+    Authorized httplib2 transport for the YouTube API.
+
+    httplib2 keeps the connection to the API host alive between requests, but has no
+    timeout by default: a stalled response would freeze the channel listing forever.
+    """
+    return google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT[1]))
+
+# youtube-transcript-api client of each worker thread, reusing its keep-alive session between videos
+transcript_clients = threading.local()
+
+def get_transcript_api() -> youtube_transcript_api.YouTubeTranscriptApi:
+    if not hasattr(transcript_clients, 'api'):
+        # The library calls http_client.get() without a timeout: the session supplies one,
+        # otherwise a stalled fetch would hang its worker (and the in-order publishing) forever
+        transcript_clients.api = youtube_transcript_api.YouTubeTranscriptApi(
+            http_client=build_http_session(timeout=HTTP_TIMEOUT)
+        )
+    return transcript_clients.api
+
+@disk_cached(os.path.join(CACHE_DIR, 'transcripts'))
 def get_video_transcript(video_id: str, language: str) -> Optional[str]:
     """
     Get video transcript in specified language. If not available directly,
@@ -123,16 +241,15 @@ def get_video_transcript(video_id: str, language: str) -> Optional[str]:
         Optional[str]: Combined transcript text or None if not available
     """
     try:
-        # Use the new API (v1.2.0+): create instance and use fetch() method directly
-        ytt_api = youtube_transcript_api.YouTubeTranscriptApi()
+        # Use the new API (v1.2.0+): fetch() method of an instance (one per thread, see get_transcript_api)
+        ytt_api = get_transcript_api()
 
         try:
             # First try to get transcript in the requested language directly
             fetched_transcript = ytt_api.fetch(video_id, languages=[language])
             print(f"✓ Found direct transcript in {language}")
-            # Convert to raw data format (list of dicts with 'text' key)
-            transcript_data = fetched_transcript.to_raw_data()
-            return " ".join([entry["text"] for entry in transcript_data])
+            # FetchedTranscript iterates over its snippets: join their text without building raw dicts
+            return " ".join(snippet.text for snippet in fetched_transcript)
         except Exception:
             try:
                 # If not found, try to get French auto-generated transcript first
@@ -143,13 +260,12 @@ def get_video_transcript(video_id: str, language: str) -> Optional[str]:
                     transcript = transcript_list.find_generated_transcript([
                                                                            'fr'])
                     transcript = transcript.translate(language)
-                    transcript_data = transcript.fetch().to_raw_data()
+                    fetched_transcript = transcript.fetch()
                     print(
                         f"✓ Using translated transcript from French to {language}")
                 else:
-                    transcript_data = fetched_transcript.to_raw_data()
                     print("✓ Using French auto-generated transcript")
-                return " ".join([entry["text"] for entry in transcript_data])
+                return " ".join(snippet.text for snippet in fetched_transcript)
             except Exception as e:
                 print(f"✗ No transcript available in any format: {e}")
                 return None
@@ -160,18 +276,186 @@ def get_video_transcript(video_id: str, language: str) -> Optional[str]:
         return None
 
 
+def chat_completion(on_prefix: Optional[Callable[[str], Any]] = None, prefix_length: int = 0, **request: Any) -> str:
+    """
+    Run an OpenAI chat completion and return the message content.
+
+    Deterministic requests (temperature 0) are cached on disk, keyed by the whole request
+    (model, messages, options), so an identical request on a later run costs nothing.
+    Sampled requests are always sent: a rerun (e.g. after deleting an article to get a
+    fresh version) must not replay the previous text.
+
+    Args:
+        on_prefix: Optional callback receiving the beginning of the content (at least
+            ``prefix_length`` characters) as soon as it is available. The response is
+            streamed when set, so the caller can start work while the rest is generated.
+        prefix_length: Number of characters to wait for before calling ``on_prefix``
+        **request: Keyword arguments of ``openai_client.chat.completions.create``
+
+    Returns:
+        str: Content of the first choice
+    """
+    cacheable = request.get('temperature', 1) <= 0
+    key = cache_key(request) if cacheable else None
+    content = openai_cache.get(key) if cacheable else None
+    if content is None:
+        if on_prefix is None:
+            response = openai_client.chat.completions.create(**request)
+            content = response.choices[0].message.content
+        else:
+            parts: List[str] = []
+            received = 0
+            for chunk in openai_client.chat.completions.create(stream=True, **request):
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                parts.append(delta)
+                received += len(delta)
+                if on_prefix is not None and received >= prefix_length:
+                    on_prefix("".join(parts))
+                    on_prefix = None
+            content = "".join(parts)
+        if content and cacheable:
+            openai_cache.set(key, content)
+
+    # Cache hit, or a response shorter than the requested prefix
+    if on_prefix is not None:
+        on_prefix(content)
+    return content
+
+
+def json_chat_completion(response_format: Dict[str, Any], **request: Any) -> str:
+    """
+    Run a chat completion constrained to a JSON schema (structured outputs).
+
+    Falls back to plain JSON mode on models that don't support ``json_schema``, so the
+    callers still parse and validate the returned JSON themselves. Any other rejected
+    request (too long, invalid model...) is raised as-is rather than sent a second time.
+
+    Args:
+        response_format: A ``{"type": "json_schema", ...}`` response format
+        **request: Other keyword arguments of ``openai_client.chat.completions.create``
+
+    Returns:
+        str: The JSON content of the first choice
+    """
+    try:
+        return chat_completion(**request, response_format=response_format)
+    except openai.BadRequestError as e:
+        if getattr(e, 'param', None) != 'response_format' and 'json_schema' not in str(e):
+            raise
+        # Model without structured outputs support: plain JSON mode
+        return chat_completion(**request, response_format={"type": "json_object"})
+
+
+def execute_with_etag(request, key: str, http=None) -> Dict[str, Any]:
+    """
+    Execute a YouTube API list request, revalidating the response cached by a previous run.
+
+    The request is sent with the cached response's ETag (If-None-Match): when nothing
+    changed, the API answers with a bodyless 304 and the cached response is returned.
+    A 304 still costs the method's full quota, so this only saves bandwidth. Only use it
+    for requests whose cache key identifies the same data from one run to the next.
+
+    Args:
+        request: googleapiclient HttpRequest (its fields must include 'etag')
+        key: Cache key of the request (see cache_key)
+        http: Optional transport to execute the request with
+
+    Returns:
+        Dict[str, Any]: The (fresh or cached) response
+    """
+    cached = youtube_cache.get(key)
+    if cached and cached.get('etag'):
+        request.headers['If-None-Match'] = cached['etag']
+
+    try:
+        response = request.execute(http=http) if http is not None else request.execute()
+    except HttpError as e:
+        if cached and e.resp.status == 304:
+            return cached['response']
+        raise
+
+    youtube_cache.set(key, {'etag': response.get('etag'), 'response': response})
+    return response
+
+
+def youtube_error_reasons(error: HttpError) -> Set[str]:
+    """Return the 'reason' codes of a YouTube API error (e.g. 'quotaExceeded')."""
+    details = error.error_details if isinstance(error.error_details, list) else []
+    return {detail.get('reason') for detail in details if isinstance(detail, dict)}
+
+
+def execute_youtube_request(request_fn: Callable[[], Dict[str, Any]], description: str,
+                            method: str) -> Optional[Dict[str, Any]]:
+    """
+    Execute a YouTube API call, retrying transient failures with jittered exponential backoff.
+
+    Every attempt is charged to the daily quota budget (failed calls cost units too).
+
+    Args:
+        request_fn: Function building and executing the request
+        description: What is being fetched, for the error messages
+        method: API method called, e.g. 'videos.list', to know its quota cost
+
+    Returns:
+        Optional[Dict[str, Any]]: The response, or None if the daily quota is exhausted,
+        the error can't be fixed by retrying, or the retries ran out
+    """
+    for attempt in range(YOUTUBE_MAX_RETRIES + 1):
+        if not youtube_quota.acquire(method):
+            print(f"⚠ Daily YouTube quota budget ({youtube_quota.daily_limit} units) reached. "
+                  f"Skipping {method}")
+            return None
+        try:
+            return request_fn()
+        except HttpError as e:
+            reasons = youtube_error_reasons(e)
+            if reasons & YOUTUBE_QUOTA_REASONS:
+                print("YouTube API quota exceeded")
+                return None
+            if e.resp.status not in YOUTUBE_RETRY_STATUS_CODES and not reasons & YOUTUBE_RATE_LIMIT_REASONS:
+                print(f"Error {description}: {e}")
+                return None
+            error: Exception = e
+        except Exception as e:
+            # Network errors (timeouts, resets, ...)
+            error = e
+
+        if attempt < YOUTUBE_MAX_RETRIES:
+            # Jittered, so the concurrent videos.list batches don't all retry at the same instant
+            delay = random.uniform(0.5, 1.5) * 2 ** attempt
+            print(f"Error {description}: {error}. Retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+    print(f"Error {description}: giving up after {YOUTUBE_MAX_RETRIES} retries")
+    return None
+
+
+# Partial responses: only the fields get_channel_videos reads (snippet alone carries thumbnails,
+# tags, localizations...), plus the etag used to revalidate cached responses
+PLAYLIST_ITEMS_FIELDS = "etag,nextPageToken,items/contentDetails(videoId,videoPublishedAt)"
+VIDEOS_FIELDS = "etag,items(id,status/privacyStatus,contentDetails/duration,snippet(title,description,publishedAt))"
+
 def get_channel_videos(youtube, channel_id: str) -> List[VideoData]:
     """
     Current implementation analysis:
-    1. Uses pagination (next_page_token) to iterate through all results
-    2. Retrieves videos in batches of 50 (maximum allowed by YouTube API)
-    3. Filters out short videos (<=60s)
-    4. Gets detailed video information including duration
+    1. Resolves the channel's "uploads" playlist (channels.list)
+    2. Paginates playlistItems.list (1 quota unit per page of 50) to collect every video ID
+    3. Gets detailed video information (videos.list) in batches of 50 IDs, the maximum allowed,
+       fetching up to YOUTUBE_DETAILS_WORKERS batches concurrently
+    4. Filters out non-public and short videos (<=60s)
+    The channel, the first page and the batches seen on a previous run are sent with
+    If-None-Match and reuse the cached response when unchanged (304, same quota cost),
+    see execute_with_etag. Later pages aren't: their page tokens shift with every upload.
+
+    Error handling:
+    - Transient errors (5xx, rate limits, network) are retried with exponential backoff
+    - An exhausted daily quota (as reported by the API, or the local YOUTUBE_DAILY_QUOTA
+      budget) stops the listing, keeping the videos found so far
 
     Limitations:
-    1. No error handling for API quotas
-    2. No rate limiting implementation
-    3. No handling for very large channels (potential timeout)
+    1. No handling for very large channels (potential timeout)
 
     Args:
         youtube: YouTube API service instance
@@ -181,195 +465,166 @@ def get_channel_videos(youtube, channel_id: str) -> List[VideoData]:
         List[VideoData]: List of published video data
     """
     def get_videos_page(youtube, uploads_playlist_id: str, page_token: Optional[str] = None):
-        return youtube.playlistItems().list(
-            part="snippet",
+        request = youtube.playlistItems().list(
+            part="contentDetails",
             playlistId=uploads_playlist_id,
             maxResults=50,
-            pageToken=page_token
-        ).execute()
+            pageToken=page_token,
+            fields=PLAYLIST_ITEMS_FIELDS
+        )
+        if page_token is not None:
+            return request.execute()
+        return execute_with_etag(request, cache_key('playlistItems.list', PLAYLIST_ITEMS_FIELDS, uploads_playlist_id))
+
+    # The service's httplib2 connection isn't thread-safe: each worker gets its own
+    thread_local = threading.local()
+    shared_http_lock = threading.Lock()
+
+    def get_videos_details(youtube, batch_ids: List[str]):
+        part = "contentDetails,snippet,status"
+        request = youtube.videos().list(part=part, id=",".join(batch_ids), fields=VIDEOS_FIELDS)
+        key = cache_key('videos.list', part, VIDEOS_FIELDS, batch_ids)
+
+        credentials = getattr(request.http, 'credentials', None)
+        if credentials is None:
+            with shared_http_lock:
+                return execute_with_etag(request, key)
+        if not hasattr(thread_local, 'http'):
+            thread_local.http = build_youtube_http(credentials)
+        return execute_with_etag(request, key, http=thread_local.http)
+
+    def fetch_batch(batch_ids: List[str]) -> Dict[str, Any]:
+        response = execute_youtube_request(
+            lambda: get_videos_details(youtube, batch_ids), "fetching video details", 'videos.list')
+        return response or {}
 
     videos = []
+    video_ids: List[str] = []
     next_page_token = None
 
     try:
         # Get uploads playlist ID for the channel
-        channel_response = youtube.channels().list(
-            part="contentDetails",
-            id=channel_id
-        ).execute()
+        channel_response = execute_youtube_request(
+            lambda: execute_with_etag(youtube.channels().list(part="contentDetails", id=channel_id),
+                                      cache_key('channels.list', 'contentDetails', channel_id)),
+            "fetching channel", 'channels.list')
+        if channel_response is None:
+            return videos
 
         if not channel_response.get("items"):
             raise ValueError(f"No channel found for ID: {channel_id}")
 
         uploads_playlist_id = channel_response["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
 
+        # Phase 1: collect every video ID of the uploads playlist
         while True:
-            try:
-                response = get_videos_page(
-                    youtube, uploads_playlist_id, next_page_token)
-
-                video_ids = [
-                    item["snippet"]["resourceId"]["videoId"]
-                    for item in response.get("items", [])
-                    if item["snippet"].get("publishedAt")
-                ]
-
-                if video_ids:
-                    # Get detailed video information in batches of 50
-                    for i in range(0, len(video_ids), 50):
-                        batch_ids = video_ids[i:i + 50]
-                        videos_response = youtube.videos().list(
-                            part="contentDetails,snippet,status",
-                            id=",".join(batch_ids)
-                        ).execute()
-
-                        for item in videos_response.get("items", []):
-                            # Only process public videos. Skip the non-public ones
-                            if item["status"]["privacyStatus"] != "public":
-                                continue
-
-                            duration_str = item["contentDetails"]["duration"]
-                            duration_seconds = parse_duration(duration_str)
-
-                            # Skip short video formats (<= 60s)
-                            if duration_seconds <= 60:
-                                continue
-
-                            video_data = VideoData(
-                                id=item["id"],
-                                title=item["snippet"]["title"],
-                                description=item["snippet"]["description"],
-                                published_at=item["snippet"]["publishedAt"],
-                                duration_seconds=duration_seconds
-                            )
-                            videos.append(video_data)
-
-                next_page_token = response.get("nextPageToken")
-                if not next_page_token:
-                    break
+            response = execute_youtube_request(
+                lambda: get_videos_page(youtube, uploads_playlist_id, next_page_token), "in pagination",
+                'playlistItems.list')
+            if response is None:
+                # Keep the video IDs collected so far
+                break
+
+            # Private and deleted videos have no videoPublishedAt
+            video_ids.extend(
+                item["contentDetails"]["videoId"]
+                for item in response.get("items", [])
+                if item["contentDetails"].get("videoPublishedAt")
+            )
 
-            except Exception as e:
-                print(f"Error in pagination: {e}")
-                # Wait before retrying or breaking
-                time.sleep(5)
-                if str(e).lower().find("quota") != -1:
-                    print("YouTube API quota exceeded")
-                    break
-                continue
+            next_page_token = response.get("nextPageToken")
+            if not next_page_token:
+                break
+
+        # Phase 2: get detailed video information in batches of 50, several batches at a time.
+        # Batches are cut from the oldest video (the playlist lists newest first), so new uploads
+        # only change the newest batch and the others can be revalidated with their ETag
+        oldest_first = video_ids[::-1]
+        batches = [oldest_first[i:i + 50] for i in range(0, len(oldest_first), 50)]
+        with ThreadPoolExecutor(max_workers=max(1, min(YOUTUBE_DETAILS_WORKERS, len(batches)))) as executor:
+            videos_responses = list(executor.map(fetch_batch, batches))
+
+        for videos_response in videos_responses:
+            for item in videos_response.get("items", []):
+                # Only process public videos. Skip the non-public ones
+                if item["status"]["privacyStatus"] != "public":
+                    continue
+
+                duration_str = item["contentDetails"]["duration"]
+                duration_seconds = parse_duration(duration_str)
+
+                # Skip short video formats (<= 60s)
+                if duration_seconds <= 60:
+                    continue
+
+                video_data = VideoData(
+                    id=item["id"],
+                    title=item["snippet"]["title"],
+                    description=item["snippet"]["description"],
+                    published_at=item["snippet"]["publishedAt"],
+                    duration_seconds=duration_seconds
+                )
+                videos.append(video_data)
 
     except Exception as e:
         print(f"Error fetching videos: {e}")
 
     # Sort videos by publish date, newest first
-    videos.sort(key=lambda x: x.published_at, reverse=True)
+    videos.sort(key=attrgetter('published_at'), reverse=True)
     return videos
 
+# ISO 8601 durations as returned by the YouTube API (PT#H#M#S, with weeks/days for very long streams)
+ISO_DURATION_PATTERN = re.compile(
+    r'P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)(?:\.\d+)?S)?)?'
+)
+
+@functools.lru_cache(maxsize=4096)
 def parse_duration(duration_str: str) -> int:
     """
     Parse ISO 8601 duration format to seconds.
     Example: PT1H2M10S -> 3730 seconds
+    Memoized: channels share a lot of identical durations (and every run re-parses them).
     """
-    try:
-        duration = isodate.parse_duration(duration_str)
-        return int(duration.total_seconds())
-    except Exception as e:
-        print(f"Error parsing duration {duration_str}: {e}")
+    match = ISO_DURATION_PATTERN.fullmatch(duration_str or '')
+    if not match:
+        print(f"Error parsing duration {duration_str}: unsupported format")
         return 0
-
-def generate_article_from_transcript(transcript: str, title: str, source_language: str = 'fr', output_language: str = 'en', video_duration: int = 0, niche: str = 'self-help') -> str:
-    """
-    Generate article from transcript with dynamic handling based on video duration.
-    
-    Args:
-        transcript: Video transcript text
-        title: Video title
-        source_language: Source language code
-        output_language: Output language code
-        video_duration: Video duration in seconds
-        niche: Content niche ('self-help' or 'tech')
-    
-    Returns:
-        Generated article content
-    """
-    client = openai.OpenAI(api_key=config['OPENAI_API_KEY'])
-    
-    # Determine transcript limit and max tokens based on video duration
-    # For 40+ minute videos, capture significantly more context for quality articles
-    if video_duration > VERY_LONG_VIDEO_DURATION:
-        transcript_limit = VERY_LONG_VIDEO_TRANSCRIPT_LIMIT
-        max_tokens = 16000
-        print(f"✓ Processing very long video ({video_duration//60} minutes) with maximum context capture")
-    elif video_duration > LONG_VIDEO_DURATION:
-        # Sweet spot for 40-60 minute videos
-        transcript_limit = LONG_VIDEO_TRANSCRIPT_LIMIT
-        max_tokens = 12000
-        print(f"✓ Processing long video ({video_duration//60} minutes) with extended context for in-depth article")
-    elif video_duration > MEDIUM_VIDEO_DURATION:
-        transcript_limit = MEDIUM_VIDEO_TRANSCRIPT_LIMIT
-        max_tokens = 8000
-        print(f"✓ Processing medium-long video ({video_duration//60} minutes) with enhanced context")
-    elif video_duration > SHORT_VIDEO_DURATION:
-        transcript_limit = MEDIUM_VIDEO_TRANSCRIPT_LIMIT
-        max_tokens = 7000
-        print(f"✓ Processing medium video ({video_duration//60} minutes)")
-    else:
-        transcript_limit = SHORT_VIDEO_TRANSCRIPT_LIMIT
-        max_tokens = 5000
-        print(f"✓ Processing short video ({video_duration//60} minutes)")
-
-    # For very long transcripts, use intelligent sampling to capture key content
-    transcript_to_use = transcript[:transcript_limit]
-    if len(transcript) > transcript_limit and video_duration > LONG_VIDEO_DURATION:
-        # Capture beginning (40%), middle (30%), and end (30%) for comprehensive coverage
-        beginning_size = int(transcript_limit * 0.4)
-        middle_size = int(transcript_limit * 0.3)
-        end_size = transcript_limit - beginning_size - middle_size
-
-        middle_start = (len(transcript) - middle_size) // 2
-        end_start = len(transcript) - end_size
-
-        transcript_to_use = (
-            transcript[:beginning_size] +
-            "\n\n[... middle section of video ...]\n\n" +
-            transcript[middle_start:middle_start + middle_size] +
-            "\n\n[... continuing to conclusion ...]\n\n" +
-            transcript[end_start:]
-        )
-        print(f"✓ Using intelligent sampling: capturing beginning, key middle section, and conclusion")
-
-    # Define instructions and prompts for both English and French languages
-    instructions = {
-        'en': {
-            'fr': "Translate the following French YouTube video transcript into English. Remove all promotional content, superfluous, 'Subscribe to my channel', introductions, conclusions.",
-            'en': "Translate the following YouTube video transcript and remove all promotional content, superfluous, 'Subscribe to my channel', introductions, conclusions.",
-            'other': lambda lang: f"Translate the following {lang} YouTube video transcript into English and remove all promotional content, superfluous, 'Subscribe to my channel', introductions, conclusions."
-        },
-        'fr': {
-            'fr': "Reformule la transcription vidéo YouTube suivante en français,",
-            'en': "Traduis la transcription vidéo YouTube suivante en français et supprime tout contenu superflus, promotionnel, les appels à s'abonner, les introductions et les conclusions,",
-            'other': lambda lang: f"Traduis la transcription vidéo YouTube suivante du {lang} vers le français, supprime tout contenu superflu, promotionnel, les appels à s'abonner, les introductions et les conclusions,",
-        }
+    weeks, days, hours, minutes, seconds = (int(group or 0) for group in match.groups())
+    return (((weeks * 7 + days) * 24 + hours) * 60 + minutes) * 60 + seconds
+
+# Markers between the beginning, middle and end samples of very long transcripts
+TRANSCRIPT_MIDDLE_MARKER = "\n\n[... middle section of video ...]\n\n"
+TRANSCRIPT_END_MARKER = "\n\n[... continuing to conclusion ...]\n\n"
+
+# Instruction opening the article prompt, per output language then source language
+ARTICLE_INSTRUCTIONS = {
+    'en': {
+        'fr': "Translate the following French YouTube video transcript into English. Remove all promotional content, superfluous, 'Subscribe to my channel', introductions, conclusions.",
+        'en': "Translate the following YouTube video transcript and remove all promotional content, superfluous, 'Subscribe to my channel', introductions, conclusions.",
+        'other': "Translate the following {language} YouTube video transcript into English and remove all promotional content, superfluous, 'Subscribe to my channel', introductions, conclusions."
+    },
+    'fr': {
+        'fr': "Reformule la transcription vidéo YouTube suivante en français,",
+        'en': "Traduis la transcription vidéo YouTube suivante en français et supprime tout contenu superflus, promotionnel, les appels à s'abonner, les introductions et les conclusions,",
+        'other': "Traduis la transcription vidéo YouTube suivante du {language} vers le français, supprime tout contenu superflu, promotionnel, les appels à s'abonner, les introductions et les conclusions,",
     }
-
-    # Define niche-specific prompts
-    if niche == 'tech':
-        # Tech CTAs - randomly select 2-3 platforms to avoid overwhelming readers
-        tech_ctas = [
-            "Get inspired by [open-source projects I've built](https://github.com/pH-7) over the years",
-            "Follow my [AI & tech journey on Substack](https://substack.com/@pierrehenry)",
-            "Check out [my book on PRO coding practices](https://github.com/pH-7/GoodJsCode)",
-            "[Learn more about me on Dev.to](https://dev.to/pierre)",
-            "[Support my work with a coffee](https://ko-fi.com/phenry) if this helped you",
-            "[Subscribe to my YouTube channel](https://www.youtube.com/@pH7Programming) for weekly programming videos"
-        ]
-        
-        # Randomly select 2-3 CTAs
-        num_ctas = random.randint(2, 3)
-        selected_ctas = random.sample(tech_ctas, num_ctas)
-        tech_cta_section = '\n'.join(selected_ctas)
-        
-        prompts = {
-            'en': f"""{{instruction}} Remove all filler sounds and verbal tics.
+}
+
+# Tech CTAs - 2 or 3 of them are randomly picked per article to avoid overwhelming readers
+TECH_CTAS = (
+    "Get inspired by [open-source projects I've built](https://github.com/pH-7) over the years",
+    "Follow my [AI & tech journey on Substack](https://substack.com/@pierrehenry)",
+    "Check out [my book on PRO coding practices](https://github.com/pH-7/GoodJsCode)",
+    "[Learn more about me on Dev.to](https://dev.to/pierre)",
+    "[Support my work with a coffee](https://ko-fi.com/phenry) if this helped you",
+    "[Subscribe to my YouTube channel](https://www.youtube.com/@pH7Programming) for weekly programming videos",
+)
+
+# Article prompts per niche and output language (only the self-help niche has French output).
+# Filled with a single str.format() call, so braces in the transcript (e.g. code) are kept as-is
+ARTICLE_PROMPTS = {
+    'tech': {
+        'en': """{instruction} Remove all filler sounds and verbal tics.
     Rewrite this as a well-structured technical article for "NextGen Dev: AI & Software Development", skipping video intro/outro and promotional content.
     
     WRITING QUALITY: Craft genuinely engaging prose. Vary sentence length and structure. Use vivid, precise language. Build momentum through smooth transitions. Hook readers from the first line and maintain their interest throughout.
@@ -397,11 +652,10 @@ def generate_article_from_transcript(transcript: str, title: str, source_languag
 
     Format as Medium.com article. Use ## for section headings and ### for subsection headings only (Medium ignores #### and below).
     DO NOT use em dashes anywhere in the article body, headings, captions, bullets, or transitions. The only allowed em dash is the attribution marker in quote blocks: > — Author. DO NOT use emojis. Avoid unnecessary buzzwords and corporate jargon unless the speaker uses them. Highlight a few important sentences if any.
-    Use Markdown for headings, code blocks, links, bold, italic:"""
-        }
-    else:  # self-help niche
-        prompts = {
-            'en': f"""{{instruction}} Remove all filler sounds like "euh...", "bah", "ben", "hein" and similar verbal tics.
+    Use Markdown for headings, code blocks, links, bold, italic:""",
+    },
+    'self-help': {
+        'en': """{instruction} Remove all filler sounds like "euh...", "bah", "ben", "hein" and similar verbal tics.
 
     WRITING QUALITY: Craft genuinely engaging prose that captivates readers. Vary sentence rhythm - mix short punchy sentences with longer flowing ones. Use vivid, concrete language over abstract concepts. Build momentum through smooth transitions between ideas. Hook readers from the opening line and reward them throughout.
 
@@ -432,10 +686,7 @@ CRITICAL RULES:
     Use ## for section headings and ### for subsection headings only (Medium ignores #### and below).
     Use simple words. DO NOT use em dashes anywhere in the article body, headings, captions, bullets, or transitions. The only allowed em dash is the attribution marker in quote blocks: > — Author. DO NOT use any emojis, and DO NOT use any unnecessary or complicated adjective such as: Unlock, Effortless, Explore, Insights, Today's Digital World, In today's world, Dive into, Refine, Evolving, Embrace, Embracing, Embark, Enrich, Envision, Unleash, Unmask, Unveil, Streamline, Fast-paced, Delve, Digital Age, Game-changer, Indulge, Merely, Endure.
     Use Markdown format for headings, links, bold, italic, etc:""",
-
-        }
-        if output_language == 'fr':  # Only self-help niche has French output
-            prompts['fr'] = f"""{{instruction}} en supprimant les sons de remplissage comme "euh...", "bah", "ben", "hein" et autres tics verbaux similaires.
+        'fr': """{instruction} en supprimant les sons de remplissage comme "euh...", "bah", "ben", "hein" et autres tics verbaux similaires.
 
     QUALITÉ RÉDACTIONNELLE: Rédige une prose captivante et soignée. Varie le rythme des phrases - alterne entre phrases courtes percutantes et phrases plus longues et fluides. Utilise un langage vivant et concret. Crée des transitions fluides entre les idées. Accroche le lecteur dès la première ligne et maintiens son intérêt tout au long de l'article.
 
@@ -477,109 +728,184 @@ CRITICAL RULES:
 
     Structure le texte en tant qu'article Medium.com français tout en gardant le même ton de voix que dans la transcription, utilise le tutoiement et prioritise les mots simples.
     Utilise ## pour les titres de section et ### pour les sous-titres de section uniquement (Medium ignore #### et en dessous).
-    N'utilise jamais de tiret cadratin dans le corps de l'article, les titres, les légendes, les listes ou les transitions. Le seul tiret cadratin autorisé est le marqueur d'attribution des citations : > — Auteur. N'utilise jamais d'emojis. Utilise le format Markdown pour les titres, liens, gras, italique, etc:"""
+    N'utilise jamais de tiret cadratin dans le corps de l'article, les titres, les légendes, les listes ou les transitions. Le seul tiret cadratin autorisé est le marqueur d'attribution des citations : > — Auteur. N'utilise jamais d'emojis. Utilise le format Markdown pour les titres, liens, gras, italique, etc:""",
+    },
+}
+
+ARTICLE_SYSTEM_MESSAGES = {
+    'en': "You are a translator and content writer expert",
+    'fr': "Tu es un expert en rédaction de contenu en ligne"
+}
+
+def generate_article_from_transcript(transcript: str, title: str, source_language: str = 'fr', output_language: str = 'en', video_duration: int = 0, niche: str = 'self-help', on_prefix: Optional[Callable[[str], Any]] = None) -> str:
+    """
+    Generate article from transcript with dynamic handling based on video duration.
+    
+    Args:
+        transcript: Video transcript text
+        title: Video title
+        source_language: Source language code
+        output_language: Output language code
+        video_duration: Video duration in seconds
+        niche: Content niche ('self-help' or 'tech')
+        on_prefix: Optional callback receiving the first TITLE_CONTEXT_CHARS characters of
+            the article as soon as they are generated (the article is streamed)
+    
+    Returns:
+        Generated article content
+    """
+    
+    # Determine transcript limit and max tokens based on video duration
+    # (bisect_left counts the thresholds the duration is strictly greater than)
+    transcript_limit, max_tokens, message = VIDEO_DURATION_SETTINGS[
+        bisect.bisect_left(VIDEO_DURATION_THRESHOLDS, video_duration)
+    ]
+    print(message.format(minutes=video_duration // 60))
+
+    # For very long transcripts, use intelligent sampling to capture key content
+    if len(transcript) > transcript_limit and video_duration > LONG_VIDEO_DURATION:
+        # Capture beginning (40%), middle (30%), and end (30%) for comprehensive coverage
+        beginning_size = int(transcript_limit * 0.4)
+        middle_size = int(transcript_limit * 0.3)
+        end_size = transcript_limit - beginning_size - middle_size
+
+        middle_start = (len(transcript) - middle_size) // 2
+        end_start = len(transcript) - end_size
+
+        # One join copies each slice once (a + chain re-copies the growing prefix each time)
+        transcript_to_use = "".join((
+            transcript[:beginning_size],
+            TRANSCRIPT_MIDDLE_MARKER,
+            transcript[middle_start:middle_start + middle_size],
+            TRANSCRIPT_END_MARKER,
+            transcript[end_start:]
+        ))
+        print(f"✓ Using intelligent sampling: capturing beginning, key middle section, and conclusion")
+    else:
+        transcript_to_use = transcript[:transcript_limit]
+
+    # Pick 2-3 CTAs for the tech niche
+    tech_cta_section = ''
+    if niche == 'tech':
+        num_ctas = random.randint(2, 3)
+        selected_ctas = random.sample(TECH_CTAS, num_ctas)
+        tech_cta_section = '\n'.join(selected_ctas)
 
     # Get the appropriate instruction based on source and output languages
-    instruction_map = instructions[output_language]
+    instruction_map = ARTICLE_INSTRUCTIONS[output_language]
     if source_language.lower() in instruction_map:
         instruction = instruction_map[source_language.lower()]
     else:
-        instruction = instruction_map['other'](source_language)
-
-    # Get the appropriate prompt template and format it with the instruction
-    prompt = prompts[output_language].format(instruction=instruction)
-
-    # Set the system message based on output language
-    system_messages = {
-        'en': "You are a translator and content writer expert",
-        'fr': "Tu es un expert en rédaction de contenu en ligne"
-    }
+        instruction = instruction_map['other'].format(language=source_language)
+
+    # Get the appropriate prompt template and fill it in
+    prompts = ARTICLE_PROMPTS['tech' if niche == 'tech' else 'self-help']
+    prompt = prompts[output_language].format(
+        instruction=instruction,
+        title=title,
+        transcript_to_use=transcript_to_use,
+        tech_cta_section=tech_cta_section
+    )
 
-    response = client.chat.completions.create(
-        model=config['OPENAI_MODEL'],
+    article_content = chat_completion(
+        model=OPENAI_MODEL,
         messages=[
-            {"role": "system", "content": system_messages[output_language]},
+            {"role": "system", "content": ARTICLE_SYSTEM_MESSAGES[output_language]},
             {"role": "user", "content": prompt}
         ],
         temperature=0.2,
-        max_completion_tokens=max_tokens
+        max_completion_tokens=max_tokens,
+        on_prefix=on_prefix,
+        prefix_length=TITLE_CONTEXT_CHARS
     )
 
-    article_content = response.choices[0].message.content
-
     print(
         f"✓ Article generated from transcript for '{title}' from '{source_language}' to '{output_language}'")
     print(f"✓ Article length: {len(article_content)} characters, used {len(transcript_to_use)} chars of transcript (from {len(transcript)} total)")
 
     return article_content
-def generate_tags(article_content: str, title: str, output_language: str = 'en', niche: str = 'self-help') -> List[str]:
-    """
-    Generate tags for an article in either English or French.
-
-    Args:
-        article_content: The content of the article
-        title: The title of the article
-        output_language: Target language ('en' or 'fr')
-        niche: Content niche ('self-help' or 'tech')
-
-    Returns:
-        List[str]: List of exactly 5 tags in the specified language
-    """
-    client = openai.OpenAI(api_key=config['OPENAI_API_KEY'])
-
-    prompts = {
-        'en': f'''Generate exactly 5 unique and relevant tags in English for this article. Return them as a JSON object with a "tags" key containing the array.
+# Tag prompts, filled with str.format(title=..., content=...)
+TAGS_PROMPTS = {
+    'en': '''Generate exactly 5 unique and relevant tags in English for this article. Return them as a JSON object with a "tags" key containing the array.
 
 Title: "{title}"
-Content: {article_content[:300]}
+Content: {content}
 
 The response should look exactly like this:
 {{"tags": ["tag1", "tag2", "tag3", "tag4", "tag5"]}}''',
 
-        'fr': f'''Génère exactement 5 tags uniques et pertinents en français pour cet article. Renvoie-les sous forme d'objet JSON avec une clé "tags" contenant le tableau.
+    'fr': '''Génère exactement 5 tags uniques et pertinents en français pour cet article. Renvoie-les sous forme d'objet JSON avec une clé "tags" contenant le tableau.
 
 Titre: "{title}"
-Contenu : {article_content[:300]}
+Contenu : {content}
 
 La réponse doit ressembler exactement à ceci :
 {{"tags": ["tag1", "tag2", "tag3", "tag4", "tag5"]}}'''
+}
+
+TAGS_SYSTEM_MESSAGES = {
+    'en': 'You are a tag generator that only outputs valid JSON objects with a "tags" array containing exactly 5 tags',
+    'fr': 'Tu es un générateur de tags qui ne produit que des objets JSON valides avec un tableau "tags" contenant exactement 5 tags'
+}
+
+# Structured output of the tags request: the model can only return this shape
+TAGS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "tags",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"tags": {"type": "array", "items": {"type": "string"}, "minItems": 5, "maxItems": 5}},
+            "required": ["tags"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Default tags for each language and niche
+DEFAULT_TAGS = {
+    'self-help': {
+        'en': ["Self Help", "Psychology", "Self Improvement", "Personal Development", "Personal Growth"],
+        'fr': ["Développement Personnel", "Psychologie", "Croissance Personnelle", "Motivation", "Bien-Être"]
+    },
+    'tech': {
+        'en': ["Programming", "Software Development", "Coding", "Technology", "Developer Tools"],
+        'fr': ["Programmation", "Développement Logiciel", "Codage", "Technologie", "Outils Développeur"]
     }
+}
 
-    system_messages = {
-        'en': 'You are a tag generator that only outputs valid JSON objects with a "tags" array containing exactly 5 tags',
-        'fr': 'Tu es un générateur de tags qui ne produit que des objets JSON valides avec un tableau "tags" contenant exactement 5 tags'
-    }
+def generate_tags(article_content: str, title: str, output_language: str = 'en', niche: str = 'self-help') -> List[str]:
+    """
+    Generate tags for an article in either English or French.
 
-    # Default tags for each language and niche
-    default_tags = {
-        'self-help': {
-            'en': ["Self Help", "Psychology", "Self Improvement", "Personal Development", "Personal Growth"],
-            'fr': ["Développement Personnel", "Psychologie", "Croissance Personnelle", "Motivation", "Bien-Être"]
-        },
-        'tech': {
-            'en': ["Programming", "Software Development", "Coding", "Technology", "Developer Tools"],
-            'fr': ["Programmation", "Développement Logiciel", "Codage", "Technologie", "Outils Développeur"]
-        }
-    }
+    Args:
+        article_content: The content of the article
+        title: The title of the article
+        output_language: Target language ('en' or 'fr')
+        niche: Content niche ('self-help' or 'tech')
+
+    Returns:
+        List[str]: List of exactly 5 tags in the specified language
+    """
 
     # Get the appropriate prompt and system message based on the output language
-    prompt = prompts.get(output_language, prompts['en'])
-    system_message = system_messages.get(output_language, system_messages['en'])
+    prompt = TAGS_PROMPTS.get(output_language, TAGS_PROMPTS['en']).format(title=title, content=article_content[:300])
+    system_message = TAGS_SYSTEM_MESSAGES.get(output_language, TAGS_SYSTEM_MESSAGES['en'])
 
     try:
-        response = client.chat.completions.create(
-            model=config['OPENAI_MODEL'],
+        content = json_chat_completion(
+            TAGS_RESPONSE_FORMAT,
+            model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": system_message},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.9,
-            max_completion_tokens=100,
-            response_format={"type": "json_object"}
+            max_completion_tokens=100
         )
 
-        # Get the response content
-        content = response.choices[0].message.content.strip()
+        content = content.strip()
 
         try:
             # Parse the JSON response
@@ -596,42 +922,19 @@ La réponse doit ressembler exactement à ceci :
 
             print(
                 f"✗ Invalid tags format. Using default tags instead. Error: {parsed_response}")
-            return default_tags.get(niche, default_tags['self-help'])[output_language]
+            return DEFAULT_TAGS.get(niche, DEFAULT_TAGS['self-help'])[output_language]
 
         except json.JSONDecodeError as je:
             print(f"JSON parsing error: {je}. Response content: {content}")
-            return default_tags.get(niche, default_tags['self-help'])[output_language]
+            return DEFAULT_TAGS.get(niche, DEFAULT_TAGS['self-help'])[output_language]
 
     except Exception as e:
         print(f"✗ Error generating tags: {e}")
-        return default_tags.get(niche, default_tags['self-help'])[output_language]
-
-def generate_article_title(article_content: str, output_language: str = 'en') -> str:
-    """
-    Generate an engaging title for Medium.com article in either English or French.
-
-    Args:
-        article_content: The content of the article
-        output_language: Target language ('en' or 'fr')
+        return DEFAULT_TAGS.get(niche, DEFAULT_TAGS['self-help'])[output_language]
 
-    Returns:
-        str: Generated title in the specified language
-    """
-    client = openai.OpenAI(api_key=config['OPENAI_API_KEY'])
-
-    prompts = {
-        'en': f"""Based on the content below, generate ONLY a clean title and subtitle.
-
-Content: {article_content[:620]}
-
-STRICT OUTPUT RULES:
-- Output ONLY two lines.
-- First line = Title (maximum 70 characters)
-- Second line = Subtitle (plain text, no markdown)
-- NEVER include the words "Title:", "Subtitle:", "Kicker:", "###", or any prompt instructions in your response.
-- Do not add any extra text, explanations, or formatting.
-
-GOAL: Create honest, specific titles that arouse genuine curiosity by showing a desirable outcome while acknowledging real friction or pain.
+# Title-writing guidelines shared by generate_article_title and generate_title_and_tags
+TITLE_GUIDELINES = {
+    'en': """GOAL: Create honest, specific titles that arouse genuine curiosity by showing a desirable outcome while acknowledging real friction or pain.
 
 PREFERRED STRUCTURES (use when they fit naturally):
 1. "How to [achieve desired outcome] without [pain/friction/struggle]"
@@ -646,11 +949,7 @@ RULES:
 
 """,
 
-        'fr': f"""À partir du contenu ci-dessous, génère un titre + sous-titre forts pour un article Medium.
-
-Contenu: {article_content[:620]}
-
-OBJECTIF : Créer des titres honnêtes, précis, qui éveillent une curiosité sincère en montrant un résultat désirable tout en reconnaissant les difficultés réelles.
+    'fr': """OBJECTIF : Créer des titres honnêtes, précis, qui éveillent une curiosité sincère en montrant un résultat désirable tout en reconnaissant les difficultés réelles.
 
 STRUCTURES DE TITRES PRÉFÉRÉES (à utiliser quand elles collent naturellement) :
 1. "Comment [obtenir le résultat souhaité] sans [galère / difficulté / friction]"   ← Structure la plus forte
@@ -670,19 +969,103 @@ RÈGLES :
 - Évite les mots hype : Débloquer, Sans effort, Révolutionnaire, etc. Utilise un langage simple et concret.
 
 """
-    }
+}
 
-    system_messages = {
-        'en': "You are a SEO copywriter expert for writing article headings",
-        'fr': "Tu es un expert SEO en rédaction de titres pour articles de blog"
-    }
+# Title prompts, filled with str.format(content=...)
+TITLE_PROMPTS = {
+    'en': """Based on the content below, generate ONLY a clean title and subtitle.
+
+Content: {content}
+
+STRICT OUTPUT RULES:
+- Output ONLY two lines.
+- First line = Title (maximum 70 characters)
+- Second line = Subtitle (plain text, no markdown)
+- NEVER include the words "Title:", "Subtitle:", "Kicker:", "###", or any prompt instructions in your response.
+- Do not add any extra text, explanations, or formatting.
+
+""" + TITLE_GUIDELINES['en'],
+
+    'fr': """À partir du contenu ci-dessous, génère un titre + sous-titre forts pour un article Medium.
+
+Contenu: {content}
+
+""" + TITLE_GUIDELINES['fr']
+}
+
+TITLE_SYSTEM_MESSAGES = {
+    'en': "You are a SEO copywriter expert for writing article headings",
+    'fr': "Tu es un expert SEO en rédaction de titres pour articles de blog"
+}
+
+# Combined title + tags prompts, filled with str.format(title=..., content=...)
+TITLE_AND_TAGS_PROMPTS = {
+    'en': """Based on the content below, generate a clean title, a subtitle and exactly 5 unique and relevant tags in English for this Medium article.
+
+Video title: "{title}"
+Content: {content}
+
+STRICT OUTPUT RULES:
+- Title: maximum 70 characters
+- Subtitle: plain text, no markdown
+- NEVER include the words "Title:", "Subtitle:", "Kicker:", "###", or any prompt instructions in the values.
+
+""" + TITLE_GUIDELINES['en'] + """Return ONLY a JSON object that looks exactly like this:
+{{"title": "Title", "subtitle": "Subtitle", "tags": ["tag1", "tag2", "tag3", "tag4", "tag5"]}}""",
+
+    'fr': """À partir du contenu ci-dessous, génère un titre + sous-titre forts et exactement 5 tags uniques et pertinents en français pour un article Medium.
+
+Titre de la vidéo : "{title}"
+Contenu: {content}
+
+""" + TITLE_GUIDELINES['fr'] + """Renvoie UNIQUEMENT un objet JSON qui ressemble exactement à ceci :
+{{"title": "Titre", "subtitle": "Sous-titre", "tags": ["tag1", "tag2", "tag3", "tag4", "tag5"]}}"""
+}
+
+TITLE_AND_TAGS_SYSTEM_MESSAGES = {
+    'en': "You are a SEO copywriter expert for writing article headings and tags. You only output valid JSON objects",
+    'fr': "Tu es un expert SEO en rédaction de titres et de tags pour articles de blog. Tu ne produis que des objets JSON valides"
+}
+
+# Structured output of the combined title + tags request: the model can only return this shape
+TITLE_AND_TAGS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "title_and_tags",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "title": {"type": "string"},
+                "subtitle": {"type": "string"},
+                "tags": {"type": "array", "items": {"type": "string"}, "minItems": 5, "maxItems": 5},
+            },
+            "required": ["title", "subtitle", "tags"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+def generate_article_title(article_content: str, output_language: str = 'en') -> str:
+    """
+    Generate an engaging title for Medium.com article in either English or French.
+
+    Args:
+        article_content: The content of the article
+        output_language: Target language ('en' or 'fr')
+
+    Returns:
+        str: Generated title in the specified language
+    """
 
     # Use the appropriate prompt and system message based on the output language
-    prompt = prompts.get(output_language, prompts['en'])  # Default to English if language not found
-    system_message = system_messages.get(output_language, system_messages['en'])
+    prompt = TITLE_PROMPTS.get(output_language, TITLE_PROMPTS['en']).format(  # Default to English if language not found
+        content=article_content[:TITLE_CONTEXT_CHARS]
+    )
+    system_message = TITLE_SYSTEM_MESSAGES.get(output_language, TITLE_SYSTEM_MESSAGES['en'])
 
-    response = client.chat.completions.create(
-        model=config['OPENAI_MODEL'],
+    content = chat_completion(
+        model=OPENAI_MODEL,
         messages=[
             {"role": "system", "content": system_message},
             {"role": "user", "content": prompt}
@@ -691,10 +1074,71 @@ RÈGLES :
         max_completion_tokens=100
     )
 
-    title = remove_disallowed_em_dashes(response.choices[0].message.content.strip('"'))
+    title = remove_disallowed_em_dashes(content.strip('"'))
     print(f"✓ Generated article title: {title}")
     return title
 
+def generate_title_and_tags(article_content: str, title: str, output_language: str = 'en', niche: str = 'self-help') -> Tuple[str, List[str]]:
+    """
+    Generate the article title and its tags with a single OpenAI request.
+
+    Replaces the separate generate_article_title + generate_tags round-trips. The response
+    is constrained to TITLE_AND_TAGS_RESPONSE_FORMAT (plain JSON mode on models without
+    structured outputs), and falls back to those two functions if it still can't be used.
+
+    Args:
+        article_content: The content of the article
+        title: The original video title
+        output_language: Target language ('en' or 'fr')
+        niche: Content niche ('self-help' or 'tech')
+
+    Returns:
+        Tuple[str, List[str]]: The generated title (title and subtitle lines) and up to 5 tags
+    """
+
+    prompt = TITLE_AND_TAGS_PROMPTS.get(output_language, TITLE_AND_TAGS_PROMPTS['en']).format(
+        title=title,
+        content=article_content[:TITLE_CONTEXT_CHARS]
+    )
+    system_message = TITLE_AND_TAGS_SYSTEM_MESSAGES.get(output_language, TITLE_AND_TAGS_SYSTEM_MESSAGES['en'])
+
+    try:
+        content = json_chat_completion(
+            TITLE_AND_TAGS_RESPONSE_FORMAT,
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.3,
+            max_completion_tokens=200
+        )
+
+        parsed_response = json.loads(content)
+        article_title = parsed_response.get("title")
+        subtitle = parsed_response.get("subtitle")
+        tags = parsed_response.get("tags")
+
+        if (isinstance(article_title, str) and article_title.strip()
+                and isinstance(tags, list) and tags and all(isinstance(tag, str) for tag in tags)):
+            # Keep the same "title line + subtitle line" shape as generate_article_title
+            lines = [article_title.strip().strip('"')]
+            if isinstance(subtitle, str) and subtitle.strip():
+                lines.append(subtitle.strip().strip('"'))
+            article_title = remove_disallowed_em_dashes('\n'.join(lines))
+            print(f"✓ Generated article title: {article_title}")
+            print(f"✓ Relevant tags (topics) generated: {tags[:5]}")
+            return article_title, tags[:5]
+
+        print(f"✗ Invalid title/tags format: {parsed_response}. Falling back to separate requests")
+
+    except Exception as e:
+        print(f"✗ Error generating title and tags together: {e}. Falling back to separate requests")
+
+    tags = generate_tags(article_content, title, output_language=output_language, niche=niche)
+    article_title = generate_article_title(article_content, output_language=output_language)
+    return article_title, tags
+
 def generate_unsplash_search_queries(article_title: str, article_snippet: str, tags: List[str], num_images: int, output_language: str = 'en') -> List[str]:
     """
     Use GPT to generate specific, visually evocative Unsplash search queries, one per
@@ -711,7 +1155,6 @@ def generate_unsplash_search_queries(article_title: str, article_snippet: str, t
     Returns:
         List[str]: List of Unsplash search query strings (always in English)
     """
-    client = openai.OpenAI(api_key=config['OPENAI_API_KEY'])
 
     prompt = f"""You are helping curate the best stock photos for a blog article on Medium.
 
@@ -735,8 +1178,8 @@ Bad examples: "personal growth", "motivation success", "self improvement", "mind
 Return ONLY a JSON object: {{"queries": ["query1", "query2", ...]}}"""
 
     try:
-        response = client.chat.completions.create(
-            model=config['OPENAI_MODEL'],
+        content = chat_completion(
+            model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": "You generate precise, vivid visual search queries for stock photo sites. Output only valid JSON."},
                 {"role": "user", "content": prompt}
@@ -746,7 +1189,7 @@ Return ONLY a JSON object: {{"queries": ["query1", "query2", ...]}}"""
             response_format={"type": "json_object"}
         )
 
-        result = json.loads(response.choices[0].message.content)
+        result = json.loads(content)
         queries = result.get('queries', [])
 
         if len(queries) >= num_images:
@@ -765,6 +1208,35 @@ Return ONLY a JSON object: {{"queries": ["query1", "query2", ...]}}"""
         return fallback[:num_images]
 
 
+# Language rules appended to the image caption prompt
+CAPTION_LANGUAGE_INSTRUCTIONS = {
+    'en': (
+        "Write each caption in English. "
+        "Each caption must be a short, punchy phrase (4 to 9 words) that connects the image to the article's theme. "
+        "Do NOT start with 'A photo of', 'An image of', or any similar phrase."
+    ),
+    'fr': (
+        "Écris chaque légende en français. "
+        "Chaque légende doit être une phrase courte et percutante (4 à 9 mots) qui relie l'image au thème de l'article. "
+        "Ne commence pas par 'Une photo de', 'Une image de' ou une formule similaire."
+    )
+}
+
+DEFAULT_CAPTION_LANGUAGE_INSTRUCTION = "Write each caption in English. Each caption must be a short, punchy phrase (4 to 9 words)."
+
+# Image captions with the photographer credit, filled with str.format(desc=..., name=..., profile_url=...)
+UNSPLASH_CAPTION_FORMATS = {
+    'en': "{desc} - Photo by [{name}]({profile_url})",
+    'fr': "{desc} - Photo de [{name}]({profile_url})"
+}
+
+# Photographer credit part of the captions above, kept when a caption is rewritten
+PHOTO_CREDIT_PATTERNS = {
+    'en': re.compile(r'(Photo by \[.+?\]\(.+?\))'),
+    'fr': re.compile(r'(Photo de \[.+?\]\(.+?\))'),
+}
+
+
 def generate_unique_image_captions(images: List['UnsplashImage'], article_title: str, article_snippet: str, output_language: str = 'en') -> List[str]:
     """
     Use GPT to generate unique, article-specific caption descriptions for each image.
@@ -786,23 +1258,11 @@ def generate_unique_image_captions(images: List['UnsplashImage'], article_title:
     if not images:
         return []
 
-    client = openai.OpenAI(api_key=config['OPENAI_API_KEY'])
 
     image_descs = [img.alt for img in images]
     numbered = '\n'.join(f'{i + 1}. "{d}"' for i, d in enumerate(image_descs))
 
-    lang_instruction = {
-        'en': (
-            "Write each caption in English. "
-            "Each caption must be a short, punchy phrase (4 to 9 words) that connects the image to the article's theme. "
-            "Do NOT start with 'A photo of', 'An image of', or any similar phrase."
-        ),
-        'fr': (
-            "Écris chaque légende en français. "
-            "Chaque légende doit être une phrase courte et percutante (4 à 9 mots) qui relie l'image au thème de l'article. "
-            "Ne commence pas par 'Une photo de', 'Une image de' ou une formule similaire."
-        )
-    }.get(output_language, "Write each caption in English. Each caption must be a short, punchy phrase (4 to 9 words).")
+    lang_instruction = CAPTION_LANGUAGE_INSTRUCTIONS.get(output_language, DEFAULT_CAPTION_LANGUAGE_INSTRUCTION)
 
     prompt = f"""Article title: "{article_title}"
 Article excerpt: {article_snippet[:350]}
@@ -822,8 +1282,8 @@ Additional rules:
 Return ONLY a JSON object: {{"captions": ["caption1", "caption2", ...]}}"""
 
     try:
-        response = client.chat.completions.create(
-            model=config['OPENAI_MODEL'],
+        content = chat_completion(
+            model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": "You write concise, unique, emotionally resonant image captions for blog articles. Output only valid JSON."},
                 {"role": "user", "content": prompt}
@@ -833,7 +1293,7 @@ Return ONLY a JSON object: {{"captions": ["caption1", "caption2", ...]}}"""
             response_format={"type": "json_object"}
         )
 
-        result = json.loads(response.choices[0].message.content)
+        result = json.loads(content)
         captions = result.get('captions', [])
 
         if len(captions) >= len(images):
@@ -850,9 +1310,33 @@ Return ONLY a JSON object: {{"captions": ["caption1", "caption2", ...]}}"""
         return [remove_disallowed_em_dashes(img.alt) for img in images]
 
 
+def unsplash_photo_fields(photo: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keep only the fields of an Unsplash search result that articles use.
+
+    A search result carries EXIF data, tags, user stats and more; trimming it before
+    caching keeps the cached searches small and quick to load.
+
+    Args:
+        photo: One entry of the search response's 'results'
+
+    Returns:
+        Dict[str, Any]: The same photo with only its ID, descriptions, regular URL and photographer
+    """
+    fields = {key: photo[key] for key in ('id', 'alt_description', 'description') if key in photo}
+    if photo.get('urls'):
+        fields['urls'] = {'regular': photo['urls'].get('regular')}
+    user = photo.get('user')
+    if user:
+        fields['user'] = {key: user[key] for key in ('name',) if key in user}
+        if user.get('links'):
+            fields['user']['links'] = {'html': user['links'].get('html')}
+    return fields
+
+
 def fetch_images_from_unsplash(query, article_title: str, output_language: str = 'en', per_page: int = 2) -> Optional[List[UnsplashImage]]:
     """
-    Fetch images from Unsplash with recursive fallback for better search results.
+    Fetch images from Unsplash, falling back to broader queries for better search results.
     Uses the article title as primary search to get images unique to each article,
     falling back to tags if the title yields no results.
     
@@ -864,90 +1348,80 @@ def fetch_images_from_unsplash(query, article_title: str, output_language: str =
     Returns:
         Optional[List[UnsplashImage]]: List of UnsplashImage objects with URLs, alt text, and attribution captions in Markdown
     """
-    # Use article title as primary search (unique per article) for more relevant images
+    # Search plan, most specific first: the article title (unique per article) when given
+    # tags, then fewer and fewer keywords. Queries are tried in order until one has results
     if isinstance(query, list):
-        search_query = article_title if article_title else ' '.join(query[:3])
+        candidates = ([article_title] if article_title else []) + [' '.join(query[:count]) for count in (3, 2, 1)]
     else:
-        search_query = query
-    
+        candidates = [query, query.split()[0]] if ' ' in query.strip() else [query]
+    search_queries = list(dict.fromkeys(candidate for candidate in candidates if candidate))
+
     unsplash_access_key = config['UNSPLASH_ACCESS_KEY']
     preferred_photographer = config.get('UNSPLASH_PREFERRED_PHOTOGRAPHER')
     results = []
-    # Random page offset (1-3) so articles with similar queries still get different images
-    random_page = random.randint(1, 3)
-    
+
     try:
-        print(f"✓ Fetching images from Unsplash for query: '{search_query}' (page {random_page})")
-
-        # If preferred photographer is configured, try to get their images first
-        if preferred_photographer:
-            # Search for images by preferred photographer with the query
-            user_search_url = (
-                f"https://api.unsplash.com/search/photos"
-                f"?query={search_query}"
-                f"&username={preferred_photographer}"
-                f"&client_id={unsplash_access_key}"
-                f"&per_page={per_page}"
-                f"&page={random_page}"
-                f"&orientation=landscape"
-            )
-            
-            user_response = requests.get(user_search_url)
-            if user_response.status_code == 200:
-                user_search_results = user_response.json()
-                results = user_search_results.get('results', [])
-                print(f"✓ Fetched {len(results)} images from preferred photographer (@{preferred_photographer}) for query '{search_query}'")
-            else:
-                print(f"✗ Failed to fetch from preferred photographer. Status: {user_response.status_code}")
-        
-        # If we need more images (either no preferred photographer or not enough images from them)
-        if len(results) < per_page:
-            remaining_images = per_page - len(results)
-            search_url = (
-                f"https://api.unsplash.com/search/photos"
-                f"?query={search_query}"
-                f"&client_id={unsplash_access_key}"
-                f"&per_page={remaining_images}"
-                f"&page={random_page}"
-                f"&orientation=landscape"
-            )
-            
-            search_response = requests.get(search_url)
-            search_response.raise_for_status()
-            search_results = search_response.json()
-
-            search_photos = search_results.get('results', [])
-            results.extend(search_photos)
-            print(f"✓ Fetched {len(search_photos)} additional images from general search")
-
-        # If no results found, fall back to tags (more generic, broader matches)
-        if not results and isinstance(query, list) and search_query == article_title:
-            print(f"✗ No images found for title '{search_query}'. Falling back to tags...")
-            tag_query = ' '.join(query[:3])
-            return fetch_images_from_unsplash(
-                query=tag_query,
-                article_title=article_title,
-                output_language=output_language,
-                per_page=per_page
-            )
-        elif not results and isinstance(query, list) and len(query) > 1:
-            print(f"✗ No images found for '{search_query}'. Trying with fewer keywords...")
-            return fetch_images_from_unsplash(
-                query=query[:-1], # Remove the last tag
-                article_title=article_title,
-                output_language=output_language,
-                per_page=per_page
-            )
-        elif not results and isinstance(query, str) and ' ' in search_query:
-            print(f"✗ No images found for '{search_query}'. Trying with simpler query...")
-            # Split the query and try with the first word only
-            simplified_query = search_query.split()[0]
-            return fetch_images_from_unsplash(
-                query=simplified_query,
-                article_title=article_title,
-                output_language=output_language,
-                per_page=per_page
-            )
+        def search_photos(params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+            """Return the HTTP status and JSON body of a search, from the cache when already run."""
+            key = cache_key({name: value for name, value in params.items() if name != 'client_id'})
+            cached = unsplash_cache.get(key)
+            if cached is not None:
+                return 200, cached
+            response = http_session.get(UNSPLASH_SEARCH_URL, params=params, timeout=HTTP_TIMEOUT)
+            if response.status_code != 200:
+                return response.status_code, {}
+            body = {'results': [unsplash_photo_fields(photo) for photo in response.json().get('results', [])]}
+            unsplash_cache.set(key, body)
+            return 200, body
+
+        def search_images(search_query: str) -> List[Dict[str, Any]]:
+            """Run one planned query, preferred photographer's images first."""
+            # Random page offset (1-3) so articles with similar queries still get different images
+            random_page = random.randint(1, 3)
+            print(f"✓ Fetching images from Unsplash for query: '{search_query}' (page {random_page})")
+
+            # General search, used to complete the preferred photographer's images (if any)
+            search_params = {
+                'query': search_query,
+                'client_id': unsplash_access_key,
+                'per_page': per_page,
+                'page': random_page,
+                'orientation': 'landscape',
+            }
+
+            found = []
+            if preferred_photographer:
+                # Search for images by preferred photographer with the query
+                user_search_params = {**search_params, 'username': preferred_photographer}
+                user_status, user_search_results = search_photos(user_search_params)
+
+                if user_status == 200:
+                    found = user_search_results.get('results', [])
+                    print(f"✓ Fetched {len(found)} images from preferred photographer (@{preferred_photographer}) for query '{search_query}'")
+                else:
+                    print(f"✗ Failed to fetch from preferred photographer. Status: {user_status}")
+
+            # If we need more images (either no preferred photographer or not enough images from them).
+            # The general search is only sent then, so it doesn't eat into the hourly Unsplash quota
+            if len(found) < per_page:
+                remaining_images = per_page - len(found)
+                search_status, search_results = search_photos(search_params)
+                if search_status != 200:
+                    raise RuntimeError(f"Unsplash search failed with status {search_status}")
+
+                general_photos = search_results.get('results', [])[:remaining_images]
+                found.extend(general_photos)
+                print(f"✓ Fetched {len(general_photos)} additional images from general search")
+            return found
+
+        # Fallbacks run one after the other: each is only needed when the previous query
+        # found nothing, and speculative searches would eat into the hourly Unsplash quota
+        for position, search_query in enumerate(search_queries):
+            results = search_images(search_query)
+            if results:
+                break
+            if position + 1 < len(search_queries):
+                print(f"✗ No images found for '{search_query}'. Trying '{search_queries[position + 1]}'...")
 
         # Deduplicate images by Unsplash photo ID
         seen_ids = set()
@@ -963,12 +1437,7 @@ def fetch_images_from_unsplash(query, article_title: str, output_language: str =
             print(f"✗ No images found for any search variation")
             return None
 
-        captions = {
-            'en': lambda desc, name, profile_url: f"{desc} - Photo by [{name}]({profile_url})",
-            'fr': lambda desc, name, profile_url: f"{desc} - Photo de [{name}]({profile_url})"
-        }
-
-        caption_formatter = captions.get(output_language, captions['en'])
+        caption_format = UNSPLASH_CAPTION_FORMATS.get(output_language, UNSPLASH_CAPTION_FORMATS['en'])
 
         processed_images = []
         for result in results:
@@ -992,7 +1461,7 @@ def fetch_images_from_unsplash(query, article_title: str, output_language: str =
                 UnsplashImage(
                     url=result.get('urls', {}).get('regular'),
                     alt=image_desc,
-                    caption=caption_formatter(image_desc, photographer_name, profile_url)
+                    caption=caption_format.format(desc=image_desc, name=photographer_name, profile_url=profile_url)
                 )
             )
         
@@ -1045,6 +1514,22 @@ def fetch_images_for_article(queries: List[str], article_title: str, output_lang
     return images
 
 
+PARAGRAPH_SEPARATOR_PATTERN = re.compile(r'\n\n')
+
+# Markdown links [text](url), reduced to their text in image alt attributes
+MARKDOWN_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+
+# Medium's API doesn't reliably render alt text as visible captions,
+# so the caption is added as italic text on the line immediately after the image.
+# The alt attribute gets a plain-text fallback; the visible caption keeps Markdown links.
+IMAGE_BLOCK_TEMPLATE = "![{alt}]({url})\n*{caption}*\n\n"
+
+
+def image_block(image: UnsplashImage) -> str:
+    """Markdown for one embedded image followed by its visible caption."""
+    return IMAGE_BLOCK_TEMPLATE.format(alt=MARKDOWN_LINK_PATTERN.sub(r'\1', image.caption), url=image.url, caption=image.caption)
+
+
 def embed_images_in_content(article_content: str, images: List[UnsplashImage], article_title: str) -> str:
     """
     Embed images in the article content using Medium-compatible Markdown format.
@@ -1062,35 +1547,28 @@ def embed_images_in_content(article_content: str, images: List[UnsplashImage], a
     if not images:
         return article_content
 
-    def strip_md_links(text: str) -> str:
-        """Convert Markdown links [text](url) to just text for use in alt attributes."""
-        return re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
-
-    def create_image_block(image: UnsplashImage) -> str:
-        # Medium's API doesn't reliably render alt text as visible captions,
-        # so we add the caption as italic text on the line immediately after the image.
-        # The alt attribute gets a plain-text fallback; the visible caption keeps Markdown links.
-        alt_caption = strip_md_links(image.caption)
-        return f"""![{alt_caption}]({image.url})\n*{image.caption}*\n\n"""
-
-    # Split content into paragraphs
-    paragraphs = article_content.split('\n\n')
-
-    # Start with header image
-    result = [create_image_block(images[0])]
+    # Paragraph boundaries (offsets of the '\n\n' separators), without splitting the content
+    separators = [match.start() for match in PARAGRAPH_SEPARATOR_PATTERN.finditer(article_content)]
+    paragraph_count = len(separators) + 1
 
     # Evenly distribute remaining images through the content
     extra_images = images[1:]
     insertion_points = {
-        (len(paragraphs) * (i + 1)) // (len(extra_images) + 1): img
+        (paragraph_count * (i + 1)) // (len(extra_images) + 1): img
         for i, img in enumerate(extra_images)
     } if extra_images else {}
 
-    for i, paragraph in enumerate(paragraphs):
-        result.append(paragraph)
-
-        if i in insertion_points:
-            result.append(create_image_block(insertion_points[i]))
+    # Start with header image, then copy the content in slices, cutting it after
+    # each paragraph that is followed by an image
+    result = [image_block(images[0])]
+    start = 0
+    for i in sorted(insertion_points):
+        end = separators[i] if i < len(separators) else len(article_content)
+        result.append(article_content[start:end])
+        result.append(image_block(insertion_points[i]))
+        start = end + 2
+    if start <= len(article_content):
+        result.append(article_content[start:])
 
     return '\n\n'.join(result)
 
@@ -1107,29 +1585,29 @@ def embed_youtube_video(article_content: str, video_id: str) -> str:
     Returns:
         str: Article content with embedded YouTube video at a random position
     """
-    # Split content into paragraphs
-    paragraphs = article_content.split('\n\n')
-    
+    # Paragraph boundaries (offsets of the '\n\n' separators), without splitting the content
+    separators = [match.start() for match in PARAGRAPH_SEPARATOR_PATTERN.finditer(article_content)]
+    paragraph_count = len(separators) + 1
+
     # If article is too short, place at the beginning
-    if len(paragraphs) < 4:
+    if paragraph_count < 4:
         youtube_embed = f"https://www.youtube.com/watch?v={video_id}\n\n---\n\n"
         return youtube_embed + article_content
     
     # Randomly choose insertion point: 1/4, 1/2, or 3/4 of the way through
     position_options = [
-        len(paragraphs) // 4,      # 25% through
-        len(paragraphs) // 2,      # 50% through
-        (len(paragraphs) * 3) // 4  # 75% through
+        paragraph_count // 4,      # 25% through
+        paragraph_count // 2,      # 50% through
+        (paragraph_count * 3) // 4  # 75% through
     ]
     insertion_point = random.choice(position_options)
     
     # Create YouTube embed block with separators
     youtube_block = f"---\n\nhttps://www.youtube.com/watch?v={video_id}\n\n---"
     
-    # Insert the video at the chosen position
-    result = paragraphs[:insertion_point] + [youtube_block] + paragraphs[insertion_point:]
-    
-    return '\n\n'.join(result)
+    # Insert the video before the separator that follows the chosen paragraph
+    cut = separators[insertion_point - 1]
+    return f"{article_content[:cut]}\n\n{youtube_block}{article_content[cut:]}"
 
 def separate_consecutive_quotes(content: str) -> str:
     """
@@ -1473,6 +1951,12 @@ def convert_markdown_to_medium_html(content: str, title: str) -> str:
     return html
 
 
+@functools.lru_cache(maxsize=None)
+def ensure_directory(path: str) -> None:
+    """Create a directory if needed; each path is only checked once per process."""
+    os.makedirs(path, exist_ok=True)
+
+
 def save_article_locally(
         video_id: str,
         original_title: str,
@@ -1504,11 +1988,10 @@ def save_article_locally(
         UnicodeEncodeError: If there are problems encoding the content
     """
     # Create the base_dir directory if it doesn't exist
-    os.makedirs(base_dir, exist_ok=True)
+    ensure_directory(base_dir)
 
-    # Create a safe filename from the original title
-    safe_title: str = "".join([c for c in original_title if c.isalpha() or c.isdigit() or c == ' ']).rstrip()
-    file_name: str = os.path.join(base_dir, f"{video_id}_{safe_title}.md")
+    # Create a safe filename from the original title (drafts that failed to publish are prefixed)
+    file_name: str = article_path(video_id, original_title, base_dir, published=medium_url != "not_published")
 
     # Check if article already exists
     if os.path.exists(file_name):
@@ -1521,11 +2004,9 @@ def save_article_locally(
     youtube_url: str = f"https://www.youtube.com/watch?v={video_id}"
 
     # Build per-platform published URL lines (one line per platform that succeeded)
-    platform_lines: str = ""
-    if published_urls:
-        for platform, url in published_urls.items():
-            if url:
-                platform_lines += f"{platform}_url: {url}\n"
+    platform_lines: str = "".join(
+        f"{platform}_url: {url}\n" for platform, url in (published_urls or {}).items() if url
+    )
 
     metadata_header: str = f"""---
 video_id: {video_id}
@@ -1540,11 +2021,8 @@ tags: {formatted_tags}
 """
 
     try:
-        with open(file_name, "w", encoding="utf-8") as file:
-            # Write yaml-like metadata
-            file.write(metadata_header)
-            # Write article content
-            file.write(article)
+        # Yaml-like metadata followed by the article content, in a single atomic write
+        write_file_atomically(file_name, metadata_header + article)
     except (OSError, UnicodeEncodeError) as e:
         print(f"✗ Error saving article: {e}")
         raise
@@ -1566,7 +2044,70 @@ def build_medium_html(markdown_content: str, title: str) -> str:
     cleaned_md = clean_article_for_medium(markdown_content)
     return convert_markdown_to_medium_html(cleaned_md, title)
 
-def check_article_exists(video_id: str, original_title: str, base_dir: str = 'articles') -> Optional[str]:
+class _SafeTitleTable(dict):
+    """
+    str.translate table dropping everything but letters, digits and spaces.
+
+    Entries are filled lazily on first sight of a code point, so accented letters
+    (French titles) are kept exactly as before while the per-character work runs in C.
+    """
+
+    def __missing__(self, code_point: int) -> Optional[int]:
+        char = chr(code_point)
+        keep = char.isalpha() or char.isdigit() or char == ' '
+        self[code_point] = code_point if keep else None
+        return self[code_point]
+
+
+_SAFE_TITLE_TABLE = _SafeTitleTable()
+
+
+def _safe_title(title: str) -> str:
+    """Keep only letters, digits and spaces so a video title can be used in a file name."""
+    return title.translate(_SAFE_TITLE_TABLE).rstrip()
+
+
+def article_file_name(video_id: str, original_title: str, published: bool = True) -> str:
+    """
+    File name of a saved article.
+
+    Args:
+        video_id (str): The unique video ID from YouTube
+        original_title (str): The original video title
+        published (bool): False for articles that failed to publish ('not_published_' prefix)
+
+    Returns:
+        str: The file name, e.g. 'abc123_My Video Title.md'
+    """
+    prefix = "" if published else "not_published_"
+    return f"{prefix}{video_id}_{_safe_title(original_title)}.md"
+
+
+def article_path(video_id: str, original_title: str, base_dir: str = 'articles', published: bool = True) -> str:
+    """Path of a saved article in base_dir (see article_file_name)."""
+    return os.path.join(base_dir, article_file_name(video_id, original_title, published))
+
+
+def list_article_files(base_dir: str) -> Set[str]:
+    """
+    List the file names of an article directory in a single directory read.
+
+    Used to turn the per-video existence checks into set lookups instead of
+    one filesystem stat per video and language.
+
+    Args:
+        base_dir (str): The article directory to list
+
+    Returns:
+        Set[str]: File names in the directory (empty if it doesn't exist yet)
+    """
+    try:
+        return set(os.listdir(base_dir))
+    except FileNotFoundError:
+        return set()
+
+
+def check_article_exists(video_id: str, original_title: str, base_dir: str = 'articles', existing: Optional[Set[str]] = None) -> Optional[str]:
     """
     Check if an article already exists locally based on the video ID and title.
 
@@ -1574,16 +2115,19 @@ def check_article_exists(video_id: str, original_title: str, base_dir: str = 'ar
         video_id (str): The unique video ID from YouTube
         original_title (str): The title of the article
         base_dir (str, optional): The base directory to search for articles. Defaults to 'articles'.
+        existing (Optional[Set[str]]): File names already listed from base_dir (see list_article_files).
+            When given, it is used instead of hitting the filesystem.
 
     Returns:
         Optional[str]: The path of the existing article file or None if it doesn't exist.
     """
-    safe_title = "".join([c for c in original_title if c.isalpha() or c.isdigit() or c == ' ']).rstrip()
-    file_name = os.path.join(base_dir, f"{video_id}_{safe_title}.md")
+    file_name = article_path(video_id, original_title, base_dir)
+    if existing is not None:
+        return file_name if os.path.basename(file_name) in existing else None
     return file_name if os.path.exists(file_name) else None
 
 
-def check_unpublished_article(video_id: str, original_title: str, base_dir: str = 'articles') -> Optional[str]:
+def check_unpublished_article(video_id: str, original_title: str, base_dir: str = 'articles', existing: Optional[Set[str]] = None) -> Optional[str]:
     """
     Check if an unpublished article exists locally for the given video ID and title.
 
@@ -1591,13 +2135,25 @@ def check_unpublished_article(video_id: str, original_title: str, base_dir: str
         video_id (str): The unique video ID from YouTube
         original_title (str): The original video title
         base_dir (str, optional): The base directory to search. Defaults to 'articles'.
+        existing (Optional[Set[str]]): File names already listed from base_dir (see list_article_files).
+            When given, it is used instead of hitting the filesystem.
 
     Returns:
         Optional[str]: Path to the unpublished article file or None if not found
     """
-    safe_title = "".join([c for c in original_title if c.isalpha() or c.isdigit() or c == ' ']).rstrip()
-    unpublished_file = os.path.join(base_dir, f"not_published_{video_id}_{safe_title}.md")
-    return unpublished_file if os.path.exists(unpublished_file) else None
+    base_names = (
+        article_file_name(video_id, original_title, published=False),
+        # Name older versions saved drafts under (the prefix went through _safe_title)
+        f"{video_id}_notpublished{_safe_title(original_title)}.md",
+    )
+    for base_name in base_names:
+        unpublished_file = os.path.join(base_dir, base_name)
+        if existing is not None:
+            if base_name in existing:
+                return unpublished_file
+        elif os.path.exists(unpublished_file):
+            return unpublished_file
+    return None
 
 
 def extract_article_from_file(file_path: str) -> Optional[Dict[str, Any]]:
@@ -1611,24 +2167,22 @@ def extract_article_from_file(file_path: str) -> Optional[Dict[str, Any]]:
         Optional[Dict[str, Any]]: Dictionary containing 'title', 'tags', 'content', or None if parsing fails
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Split metadata from article content
-        parts = content.split('---\n')
-        if len(parts) < 3:
-            print(f"✗ Invalid article format in {file_path}")
-            return None
-        
-        metadata_section = parts[1]
-        article_content = '---\n'.join(parts[2:]).strip()
-        
-        # Parse metadata
         metadata = {}
-        for line in metadata_section.split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                metadata[key.strip()] = value.strip()
+        with open(file_path, 'r', encoding='utf-8') as f:
+            # Read the metadata header line by line up to its closing "---", then
+            # take the rest of the file as the article in one read
+            separators = 0
+            while separators < 2:
+                line = f.readline()
+                if not line:
+                    print(f"✗ Invalid article format in {file_path}")
+                    return None
+                if line == '---\n':
+                    separators += 1
+                elif separators == 1 and ':' in line:
+                    key, value = line.split(':', 1)
+                    metadata[key.strip()] = value.strip()
+            article_content = f.read().strip()
         
         # Extract required fields
         optimized_title = metadata.get('optimized_title', '')
@@ -1664,8 +2218,7 @@ def rename_published_article(old_path: str, video_id: str, original_title: str,
         Optional[str]: New file path or None if rename fails
     """
     try:
-        safe_title = "".join([c for c in original_title if c.isalpha() or c.isdigit() or c == ' ']).rstrip()
-        new_path = os.path.join(base_dir, f"{video_id}_{safe_title}.md")
+        new_path = article_path(video_id, original_title, base_dir)
         
         os.rename(old_path, new_path)
         print(f"✓ Renamed article: {os.path.basename(old_path)} → {os.path.basename(new_path)}")
@@ -1676,6 +2229,28 @@ def rename_published_article(old_path: str, video_id: str, original_title: str,
         return None
 
 
+def set_aside_unreadable_draft(file_path: str, existing: Optional[Set[str]] = None) -> None:
+    """
+    Rename a draft that can't be parsed to '<name>.invalid', so the article is generated again.
+
+    The file is kept for inspection, and the suffix keeps it out of the article listings
+    and existence checks.
+
+    Args:
+        file_path (str): Path of the unreadable draft
+        existing (Optional[Set[str]]): Listed file names of the draft's directory, updated in place
+    """
+    invalid_path = f"{file_path}.invalid"
+    try:
+        os.replace(file_path, invalid_path)
+    except OSError as e:
+        print(f"✗ Error setting aside unreadable draft {file_path}: {e}")
+        return
+    if existing is not None:
+        existing.discard(os.path.basename(file_path))
+    print(f"⚠ Unreadable draft renamed to {os.path.basename(invalid_path)}, the article will be generated again")
+
+
 def update_article_medium_url(file_path: str, medium_url: str) -> bool:
     """
     Update the medium_url field in an article's metadata.
@@ -1691,11 +2266,12 @@ def update_article_medium_url(file_path: str, medium_url: str) -> bool:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # Replace the medium_url in metadata
-        updated_content = content.replace('medium_url: not_published', f'medium_url: {medium_url}')
+        # Replace the medium_url in metadata (the header comes first, so the article body is never touched)
+        updated_content = content.replace('medium_url: not_published', f'medium_url: {medium_url}', 1)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+        # The URL changes the header length, so the file is rewritten; only when needed, and atomically
+        if updated_content != content:
+            write_file_atomically(file_path, updated_content)
         
         return True
     
@@ -1704,20 +2280,181 @@ def update_article_medium_url(file_path: str, medium_url: str) -> bool:
         return False
 
 
-def process_niche(youtube, niche_name: str, niche_config: Dict[str, Any], publishers: List[Any]):
+def generate_article_for_language(transcript: str, video: VideoData, niche_name: str, source_language: str, output_language: str) -> GeneratedArticle:
+    """
+    Turn a video transcript into a ready-to-publish article for one output language.
+
+    Covers every step that doesn't touch the publishing platforms: article, tags and
+    title generation, image search and captions, YouTube embed and Markdown clean-up.
+
+    Args:
+        transcript: Video transcript in the source language
+        video: The video being processed
+        niche_name: Name of the niche ('self-help' or 'tech')
+        source_language: Source language code of the transcript
+        output_language: Output language code of the article
+
+    Returns:
+        GeneratedArticle: The optimized title, tags and cleaned Markdown content
+    """
+    # Title and tags only need the beginning of the article: generate them while the rest is streamed
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        title_and_tags: List[Future] = []
+
+        def start_title_and_tags(article_prefix: str) -> None:
+            title_and_tags.append(executor.submit(
+                generate_title_and_tags, article_prefix, video.title, output_language=output_language, niche=niche_name
+            ))
+
+        article = generate_article_from_transcript(
+            transcript,
+            video.title,
+            source_language=source_language,
+            output_language=output_language,
+            video_duration=video.duration_seconds,
+            niche=niche_name,
+            on_prefix=start_title_and_tags
+        )
+
+        optimized_title, tags = title_and_tags[0].result()
+
+    # Retrieve images. Number of images depends if the article is long or short
+    images_per_article = 4 if len(article) > VERY_LONG_ARTICLE_THRESHOLD else (
+        3 if len(article) > LONG_ARTICLE_THRESHOLD else 2)
+
+    # Step 1 — Generate targeted visual search queries (one per image slot).
+    # These are crafted from the article's content so every image is
+    # topically and emotionally relevant, not just a generic keyword match.
+    visual_queries = generate_unsplash_search_queries(
+        article_title=optimized_title,
+        article_snippet=article[:500],
+        tags=tags,
+        num_images=images_per_article,
+        output_language=output_language
+    )
+
+    # Step 2 — Fetch one distinct image per query for a varied, curated set.
+    images = fetch_images_for_article(
+        queries=visual_queries,
+        article_title=optimized_title,
+        output_language=output_language
+    )
+
+    if images:
+        # Step 3 — Generate unique, article-specific caption descriptions.
+        # Replaces the raw Unsplash alt_description with something that
+        # ties each image directly to this article's message.
+        unique_caption_descs = generate_unique_image_captions(
+            images=images,
+            article_title=optimized_title,
+            article_snippet=article[:400],
+            output_language=output_language
+        )
+
+        # Step 4 — Apply unique captions to images, preserving photographer credit.
+        # The photographer attribution part is extracted from the existing caption
+        # and reused; only the descriptive portion is replaced.
+        credit_pattern = PHOTO_CREDIT_PATTERNS.get(output_language, PHOTO_CREDIT_PATTERNS['en'])
+        for image, new_desc in zip(images, unique_caption_descs):
+            credit_match = credit_pattern.search(image.caption)
+            if credit_match and new_desc:
+                image.caption = f"{new_desc} - {credit_match.group(1)}"
+                image.alt = new_desc
+
+        article = embed_images_in_content(article, images, optimized_title)
+
+    # Embed YouTube video for tech niche only
+    if niche_name == 'tech':
+        article = embed_youtube_video(article, video.id)
+        print(f"✓ Embedded YouTube video in article")
+
+    # Clean Markdown for local save (fix unsupported headings, blockquotes, etc.)
+    # Note: the Medium publisher also cleans + converts to HTML internally
+    article = clean_article_for_medium(article)
+
+    return GeneratedArticle(title=optimized_title, tags=tags, content=article)
+
+
+def transcript_digest(transcript: str) -> str:
+    """Fingerprint of a transcript, ignoring case and whitespace differences."""
+    normalized = " ".join(transcript.lower().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def generate_video_articles(video: VideoData, niche_name: str, source_language: str, output_languages: List[str],
+                            processed: Optional[ProcessedIndex] = None) -> Dict[str, GeneratedArticle]:
+    """
+    Generate the articles of one video for every requested output language.
+
+    The transcript is fetched once and shared by all languages, which are then
+    generated concurrently (their OpenAI and Unsplash calls are independent).
+    Runs on a worker thread (see process_niche), so it never publishes anything itself.
+
+    Args:
+        video: The video to turn into articles
+        niche_name: Name of the niche ('self-help' or 'tech')
+        source_language: Source language code of the video
+        output_languages: Output languages that still need an article
+        processed: Index of the transcripts already published, so re-uploads are skipped
+
+    Returns:
+        Dict[str, GeneratedArticle]: Generated article per output language (missing on failure)
+    """
+    articles: Dict[str, GeneratedArticle] = {}
+
+    transcript = get_video_transcript(video.id, language=source_language)
+    if not transcript:
+        print(f"No transcript available for: {video.title}")
+        return articles
+
+    # A re-upload has the same transcript as the original video: don't pay for (and publish) it twice.
+    # The transcript is only claimed once published (see process_niche), so a failed
+    # generation or publish never keeps it from its original video
+    digest = transcript_digest(transcript)
+    owner = processed.transcript_owner(digest) if processed is not None else None
+    if owner is not None and owner != video.id:
+        print(f"⚠ '{video.title}' has the same transcript as video {owner} (re-upload?). Skipping")
+        return articles
+
+    with ThreadPoolExecutor(max_workers=max(1, len(output_languages))) as executor:
+        futures = {
+            output_language: executor.submit(
+                generate_article_for_language, transcript, video, niche_name, source_language, output_language
+            )
+            for output_language in output_languages
+        }
+        for output_language, future in futures.items():
+            try:
+                articles[output_language] = future.result()
+                articles[output_language].transcript_digest = digest
+            except Exception as e:
+                print(f"✗ Error generating article for {video.title} in {output_language}: {e}")
+
+    return articles
+
+
+def process_niche(youtube, niche_name: str, niche_config: Dict[str, Any], publishers: List[Any], processed: Optional[ProcessedIndex] = None):
     """
     Process videos for a specific niche.
+
+    Article generation (transcript, OpenAI, Unsplash) runs for up to
+    MAX_CONCURRENT_VIDEOS videos at once on worker threads, while publishing stays
+    on this thread, in channel order, at the rate-limited pace. Only a bounded
+    number of videos are generated ahead of publishing, so stopping the run never
+    throws away more than a few paid-for articles.
     
     Args:
         youtube: YouTube API service instance
         niche_name: Name of the niche ('self-help' or 'tech')
         niche_config: Configuration dictionary for the niche
         publishers: List of configured platform publishers (currently Medium)
+        processed: Index of already-published videos (checked before the article directories)
     """
     channel_id = niche_config['YOUTUBE_CHANNEL_ID']
     source_language = niche_config.get('SOURCE_LANGUAGE', 'en')
     output_languages = niche_config.get('OUTPUT_LANGUAGES', ['en'])
     base_dir = niche_config.get('ARTICLES_BASE_DIR', 'articles')
+    max_workers = MAX_CONCURRENT_VIDEOS
     
     print(f"\n{'='*60}")
     print(f"Processing niche: {niche_name.upper()}")
@@ -1729,195 +2466,213 @@ def process_niche(youtube, niche_name: str, niche_config: Dict[str, Any], publis
     videos = get_channel_videos(youtube, channel_id)
     print(f"Found {len(videos)} videos in the {niche_name} channel")
 
-    for index, video in enumerate(videos, 1):
-        try:
-            # Quick check: if article exists for all output languages, skip without waiting
-            all_exist = True
-            for output_language in output_languages:
-                # Determine article directory
-                if niche_name == 'self-help' and output_language != 'en':
-                    article_dir = f"{base_dir}/{output_language}"
-                else:
-                    article_dir = base_dir
-                
-                # Check if article exists or if unpublished version exists
-                if not (check_article_exists(video.id, video.title, base_dir=article_dir) or
-                        check_unpublished_article(video.id, video.title, base_dir=article_dir)):
-                    all_exist = False
-                    break
-            
-            # If all articles exist, skip immediately without rate limiting
-            if all_exist:
-                print(f"[{index}/{len(videos)}] Already exists locally. Skipping '{video.title}' (no wait)")
+    # List each article directory once per run; existence checks become set lookups
+    article_index: Dict[str, Set[str]] = {}
+
+    def existing_files(article_dir: str) -> Set[str]:
+        if article_dir not in article_index:
+            article_index[article_dir] = list_article_files(article_dir)
+        return article_index[article_dir]
+
+    def article_dir_for(output_language: str) -> str:
+        if niche_name == 'self-help' and output_language != 'en':
+            return f"{base_dir}/{output_language}"
+        return base_dir
+
+    def is_published(video: VideoData, output_language: str) -> bool:
+        return processed is not None and processed.is_processed(video.id, niche_name, output_language)
+
+    def languages_to_generate(video: VideoData) -> List[str]:
+        # Languages neither recorded as published nor with an article on disk
+        missing = []
+        for output_language in output_languages:
+            if is_published(video, output_language):
                 continue
-            
-            # Apply rate limiting only for videos that need processing
-            print(f"Waiting for {RATE_LIMIT_PERIOD_SECONDS} seconds before processing the next video...")
-            print_progress_separator(index, len(videos), video.title)
-            
-            # Process for each output language
-            for output_language in output_languages:
-                try:
-                    # Determine article directory
-                    if niche_name == 'self-help' and output_language != 'en':
-                        article_dir = f"{base_dir}/{output_language}"
-                    else:
-                        article_dir = base_dir
-                    
-                    # Skip if article already exists and is published
-                    if check_article_exists(video.id, video.title, base_dir=article_dir):
-                        print(f"Already exists locally. Skipping '{video.title}' for {output_language}")
-                        continue
-                    
-                    # Check for unpublished article and try to publish it first (saves OpenAI credits)
-                    unpublished_path = check_unpublished_article(video.id, video.title, base_dir=article_dir)
-                    if unpublished_path:
-                        print(f"✓ Found unpublished article: {os.path.basename(unpublished_path)}")
-                        print(f"✓ Attempting to publish existing article (avoiding OpenAI regeneration)...")
-                        
-                        article_data = extract_article_from_file(unpublished_path)
-                        if article_data:
-                            try:
-                                results = publish_to_all(
-                                    publishers,
-                                    title=article_data['title'],
-                                    content=article_data['content'],
-                                    tags=article_data['tags'],
-                                    output_language=output_language,
-                                    niche=niche_name
-                                )
-                                primary_url = select_primary_url(results)
-
-                                if any(r.success for r in results.values()):
-                                    print(f"✓ Successfully published! URL: {primary_url}")
-                                    # Update the primary published URL in the file
-                                    if update_article_medium_url(unpublished_path, primary_url):
-                                        # Rename file to remove 'not_published_' prefix
-                                        new_path = rename_published_article(unpublished_path, video.id, video.title, article_dir)
-                                        if new_path:
-                                            print(f"✓ Article optimization complete - saved OpenAI API credits!")
-                                            continue
-                                else:
-                                    print(f"✗ Publication failed again, will keep as unpublished")
-                                    continue
-                            except Exception as e:
-                                print(f"✗ Error publishing existing article: {e}")
-                                continue
-                    
-                    # If no unpublished article exists, generate new content from transcript
-                    transcript = get_video_transcript(video.id, language=source_language)
-                    if not transcript:
-                        print(f"No transcript available for: {video.title}")
+            article_dir = article_dir_for(output_language)
+            existing = existing_files(article_dir)
+            if check_article_exists(video.id, video.title, base_dir=article_dir, existing=existing):
+                continue
+            draft_path = check_unpublished_article(video.id, video.title, base_dir=article_dir, existing=existing)
+            if draft_path and extract_article_from_file(draft_path) is None:
+                # A draft that can't be read (e.g. cut short) can never be published: generate the article again
+                set_aside_unreadable_draft(draft_path, existing)
+                draft_path = None
+            if not draft_path:
+                missing.append(output_language)
+        return missing
+
+    def has_unpublished(video: VideoData) -> bool:
+        # Saved drafts whose publishing failed in a previous run
+        return any(
+            not is_published(video, output_language) and
+            check_unpublished_article(video.id, video.title, base_dir=article_dir_for(output_language),
+                                      existing=existing_files(article_dir_for(output_language)))
+            for output_language in output_languages
+        )
+
+    def publish_video(index: int, video: VideoData, generated: Dict[str, GeneratedArticle]) -> None:
+        # Another video with the same transcript may have been published since generation started.
+        # Checked before waiting, so a skipped re-upload doesn't take a publish slot
+        unclaimed: Dict[str, GeneratedArticle] = {}
+        for output_language, generated_article in generated.items():
+            digest = generated_article.transcript_digest
+            owner = processed.transcript_owner(digest) if processed is not None and digest else None
+            if owner is not None and owner != video.id:
+                print(f"⚠ '{video.title}' has the same transcript as video {owner} (re-upload?). Skipping")
+                continue
+            unclaimed[output_language] = generated_article
+        generated = unclaimed
+
+        if not generated and not has_unpublished(video):
+            print(f"[{index}/{total}] Nothing to publish for '{video.title}' (no wait)")
+            return
+
+        # Apply rate limiting only for videos that have something to publish
+        wait_for_publish_slot()
+        print_progress_separator(index, total, video.title)
+
+        # Process for each output language
+        for output_language in output_languages:
+            try:
+                # Skip if the article was already published in a previous run
+                if is_published(video, output_language):
+                    print(f"Already published. Skipping '{video.title}' for {output_language}")
+                    continue
+
+                article_dir = article_dir_for(output_language)
+                existing = existing_files(article_dir)
+
+                # Skip if article already exists and is published
+                if check_article_exists(video.id, video.title, base_dir=article_dir, existing=existing):
+                    print(f"Already exists locally. Skipping '{video.title}' for {output_language}")
+                    continue
+
+                # Check for unpublished article and try to publish it first (saves OpenAI credits)
+                unpublished_path = check_unpublished_article(video.id, video.title, base_dir=article_dir, existing=existing)
+                if unpublished_path:
+                    print(f"✓ Found unpublished article: {os.path.basename(unpublished_path)}")
+                    print(f"✓ Attempting to publish existing article (avoiding OpenAI regeneration)...")
+
+                    article_data = extract_article_from_file(unpublished_path)
+                    if article_data:
+                        try:
+                            results = publish_to_all(
+                                publishers,
+                                title=article_data['title'],
+                                content=article_data['content'],
+                                tags=article_data['tags'],
+                                output_language=output_language,
+                                niche=niche_name
+                            )
+                            primary_url = select_primary_url(results)
+
+                            if any(r.success for r in results.values()):
+                                print(f"✓ Successfully published! URL: {primary_url}")
+                                if processed is not None:
+                                    processed.mark_processed(video.id, niche_name, output_language, primary_url)
+                                # Update the primary published URL in the file
+                                if update_article_medium_url(unpublished_path, primary_url):
+                                    # Rename file to remove 'not_published_' prefix
+                                    new_path = rename_published_article(unpublished_path, video.id, video.title, article_dir)
+                                    if new_path:
+                                        existing.discard(os.path.basename(unpublished_path))
+                                        existing.add(os.path.basename(new_path))
+                                        print(f"✓ Article optimization complete - saved OpenAI API credits!")
+                            else:
+                                print(f"✗ Publication failed again, will keep as unpublished")
+                        except Exception as e:
+                            print(f"✗ Error publishing existing article: {e}")
                         continue
-                    
-                    article = generate_article_from_transcript(
-                        transcript,
-                        video.title,
-                        source_language=source_language,
+
+                    # Unreadable draft: use the freshly generated article instead (if any)
+                    set_aside_unreadable_draft(unpublished_path, existing)
+
+                generated_article = generated.get(output_language)
+                if not generated_article:
+                    continue
+
+                digest = generated_article.transcript_digest
+
+                # Publish to every configured platform (currently Medium).
+                # Saving locally still happens even if all publishers fail.
+                published_urls: Dict[str, str] = {}
+                try:
+                    results = publish_to_all(
+                        publishers,
+                        title=generated_article.title,
+                        content=generated_article.content,
+                        tags=generated_article.tags,
                         output_language=output_language,
-                        video_duration=video.duration_seconds,
                         niche=niche_name
                     )
-                    
-                    tags = generate_tags(article, video.title, output_language=output_language, niche=niche_name)
-                    optimized_title = generate_article_title(article, output_language=output_language)
-
-                    # Retrieve images. Number of images depends if the article is long or short
-                    images_per_article = 4 if len(article) > VERY_LONG_ARTICLE_THRESHOLD else (
-                        3 if len(article) > LONG_ARTICLE_THRESHOLD else 2)
-
-                    # Step 1 — Generate targeted visual search queries (one per image slot).
-                    # These are crafted from the article's content so every image is
-                    # topically and emotionally relevant, not just a generic keyword match.
-                    visual_queries = generate_unsplash_search_queries(
-                        article_title=optimized_title,
-                        article_snippet=article[:500],
-                        tags=tags,
-                        num_images=images_per_article,
-                        output_language=output_language
-                    )
-
-                    # Step 2 — Fetch one distinct image per query for a varied, curated set.
-                    images = fetch_images_for_article(
-                        queries=visual_queries,
-                        article_title=optimized_title,
-                        output_language=output_language
-                    )
+                    published_urls = {
+                        name: r.url for name, r in results.items() if r.success and r.url
+                    }
+                    medium_url = select_primary_url(results)
+                    if medium_url not in ("not_published", "posted_as_draft"):
+                        print(f"✓ Article available at: {medium_url}")
+                except Exception as e:
+                    print(f"✗ Failed to publish article: {e}")
+                    medium_url = "not_published"
+
+                saved_path = save_article_locally(
+                    video.id,
+                    video.title,
+                    generated_article.title,
+                    generated_article.tags,
+                    generated_article.content,
+                    medium_url,
+                    base_dir=article_dir,
+                    published_urls=published_urls
+                )
+                existing.add(os.path.basename(saved_path))
+                if processed is not None and medium_url != "not_published":
+                    processed.mark_processed(video.id, niche_name, output_language, medium_url)
+                    if digest:
+                        processed.claim_transcript(digest, video.id)
 
-                    if images:
-                        # Step 3 — Generate unique, article-specific caption descriptions.
-                        # Replaces the raw Unsplash alt_description with something that
-                        # ties each image directly to this article's message.
-                        unique_caption_descs = generate_unique_image_captions(
-                            images=images,
-                            article_title=optimized_title,
-                            article_snippet=article[:400],
-                            output_language=output_language
-                        )
-
-                        # Step 4 — Apply unique captions to images, preserving photographer credit.
-                        # The photographer attribution part is extracted from the existing caption
-                        # and reused; only the descriptive portion is replaced.
-                        photo_credit_patterns = {
-                            'en': r'(Photo by \[.+?\]\(.+?\))',
-                            'fr': r'(Photo de \[.+?\]\(.+?\))',
-                        }
-                        credit_pattern = photo_credit_patterns.get(output_language, photo_credit_patterns['en'])
-                        for image, new_desc in zip(images, unique_caption_descs):
-                            credit_match = re.search(credit_pattern, image.caption)
-                            if credit_match and new_desc:
-                                image.caption = f"{new_desc} - {credit_match.group(1)}"
-                                image.alt = new_desc
-
-                        article = embed_images_in_content(article, images, optimized_title)
-
-                    # Embed YouTube video for tech niche only
-                    if niche_name == 'tech':
-                        article = embed_youtube_video(article, video.id)
-                        print(f"✓ Embedded YouTube video in article")
-
-                    # Clean Markdown for local save (fix unsupported headings, blockquotes, etc.)
-                    # Note: the Medium publisher also cleans + converts to HTML internally
-                    article = clean_article_for_medium(article)
-
-                    # Publish to every configured platform (currently Medium).
-                    # Saving locally still happens even if all publishers fail.
-                    published_urls: Dict[str, str] = {}
-                    try:
-                        results = publish_to_all(
-                            publishers,
-                            title=optimized_title,
-                            content=article,
-                            tags=tags,
-                            output_language=output_language,
-                            niche=niche_name
-                        )
-                        published_urls = {
-                            name: r.url for name, r in results.items() if r.success and r.url
-                        }
-                        medium_url = select_primary_url(results)
-                        if medium_url not in ("not_published", "posted_as_draft"):
-                            print(f"✓ Article available at: {medium_url}")
-                    except Exception as e:
-                        print(f"✗ Failed to publish article: {e}")
-                        medium_url = "not_published"
-
-                    save_article_locally(
-                        video.id,
-                        "not_published_" + video.title if medium_url == "not_published" else video.title,
-                        optimized_title,
-                        tags,
-                        article,
-                        medium_url,
-                        base_dir=article_dir,
-                        published_urls=published_urls
+            except Exception as e:
+                print(f"✗ Error processing video {video.title} for {output_language}: {e}")
+
+    # Keep only the videos with work left (articles to generate, or drafts to publish again),
+    # so the progress counts and the worker slots only cover real work
+    todo: List[Tuple[VideoData, List[str]]] = []
+    for video in videos:
+        missing_languages = languages_to_generate(video)
+        if missing_languages or has_unpublished(video):
+            todo.append((video, missing_languages))
+    total = len(todo)
+    print(f"✓ {total} videos to process, {len(videos) - total} already processed (skipped without waiting)")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # (index, video, future generating its missing articles), in channel order
+        in_flight: Deque[Tuple[int, VideoData, Future]] = deque()
+        remaining = iter(enumerate(todo, 1))
+
+        def submit_next() -> None:
+            for index, (video, missing_languages) in remaining:
+                if missing_languages:
+                    future = executor.submit(
+                        generate_video_articles, video, niche_name, source_language, missing_languages, processed
                     )
-
-                except Exception as e:
-                    print(f"✗ Error processing video {video.title} for {output_language}: {e}")
-        
-        except Exception as e:
-            print(f"✗ Error processing video {video.title}: {e}")
+                else:
+                    # Nothing to generate, only saved drafts to publish again
+                    future = Future()
+                    future.set_result({})
+                in_flight.append((index, video, future))
+                return
+
+        for _ in range(max_workers):
+            submit_next()
+
+        while in_flight:
+            index, video, future = in_flight.popleft()
+            submit_next()
+            try:
+                generated = future.result()
+                publish_video(index, video, generated)
+            except Exception as e:
+                print(f"✗ Error processing video {video.title}: {e}")
 
 def run_book_compilation(config: Dict[str, Any]) -> None:
     """
@@ -2062,13 +2817,28 @@ def main():
         print(f"✗ Invalid ACTIVE_NICHE: {active_niche}")
         return
 
+    # Look up the Medium user id while the videos are being listed and generated
+    # (only needed when some of these niches and languages post to the user's profile)
+    prepare_publishers_in_background(publishers, [
+        (niche_name, output_language)
+        for niche_name, niche_config in niches_to_process
+        for output_language in niche_config.get('OUTPUT_LANGUAGES', ['en'])
+    ])
+
+    # Published videos are recorded here so later runs skip them without scanning the article directories
+    processed = ProcessedIndex(config.get('STATE_DB', 'state.db'))
+    print(f"✓ {len(processed)} article(s) already recorded as published")
+
     # Process each niche
-    for niche_name, niche_config in niches_to_process:
-        try:
-            process_niche(youtube, niche_name, niche_config, publishers)
-        except Exception as e:
-            print(f"✗ Error processing {niche_name} niche: {e}")
-            continue
+    try:
+        for niche_name, niche_config in niches_to_process:
+            try:
+                process_niche(youtube, niche_name, niche_config, publishers, processed)
+            except Exception as e:
+                print(f"✗ Error processing {niche_name} niche: {e}")
+                continue
+    finally:
+        processed.close()
 
     print("\n✓ All niches processed successfully!")
 
@@ -0,0 +1,97 @@
+"""
+YouTube Data API quota accounting.
+
+The API grants a daily budget of units (10,000 by default) that resets at
+midnight Pacific time, and every method has a fixed cost (1 unit for the list
+calls used here, 100 for search.list). The pipeline records the units it spends
+in a small JSON file so several runs on the same day share one budget, and stops
+calling the API before the budget runs out instead of failing half-way through
+a channel listing.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from atomic_file import write_file_atomically
+
+try:
+    from zoneinfo import ZoneInfo
+
+    _PACIFIC = ZoneInfo("America/Los_Angeles")
+except Exception:  # no tz database (e.g. Windows without tzdata)
+    _PACIFIC = timezone(timedelta(hours=-8))
+
+#: Quota cost of each YouTube Data API method used (or likely to be used).
+METHOD_COSTS: Dict[str, int] = {
+    "channels.list": 1,
+    "playlistItems.list": 1,
+    "videos.list": 1,
+    "search.list": 100,
+}
+
+DEFAULT_DAILY_QUOTA = 10000
+
+
+def _quota_day() -> str:
+    """The current quota day (quotas reset at midnight Pacific time)."""
+    return datetime.now(_PACIFIC).strftime("%Y-%m-%d")
+
+
+class YouTubeQuota:
+    """Thread-safe daily budget of YouTube API units, persisted between runs."""
+
+    def __init__(self, path: str = "youtube_quota.json", daily_limit: int = DEFAULT_DAILY_QUOTA):
+        self.path = path
+        self.daily_limit = daily_limit
+        self._lock = threading.Lock()
+        self._day = _quota_day()
+        self._used = 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("day") == self._day:
+                self._used = int(state.get("used", 0))
+        except (OSError, ValueError):
+            pass
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            self._roll_over()
+            return max(0, self.daily_limit - self._used)
+
+    def acquire(self, method: str, cost: Optional[int] = None) -> bool:
+        """
+        Reserve the units of one API call.
+
+        Args:
+            method: API method, e.g. 'videos.list' (see METHOD_COSTS)
+            cost: Explicit cost, overriding METHOD_COSTS
+
+        Returns:
+            bool: False (and nothing reserved) if the call would exceed the daily budget
+        """
+        units = cost if cost is not None else METHOD_COSTS.get(method, 1)
+        with self._lock:
+            self._roll_over()
+            if self._used + units > self.daily_limit:
+                return False
+            self._used += units
+            self._save()
+        return True
+
+    def _roll_over(self) -> None:
+        day = _quota_day()
+        if day != self._day:
+            self._day = day
+            self._used = 0
+
+    def _save(self) -> None:
+        try:
+            write_file_atomically(self.path, json.dumps({"day": self._day, "used": self._used}))
+        except OSError as e:
+            print(f"⚠ Could not save YouTube quota usage to {self.path}: {e}")